@@ -5,12 +5,115 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 from io import StringIO
 import sys
+from types import SimpleNamespace
 
 # Import main module
 sys.path.insert(0, "/Users/mathewwerber/projects/orionv2")
 import main
 
 
+class _StubResponse:
+    """Minimal stand-in for a command response; tests only call to_dict()."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: dict) -> None:
+        self._data = data
+
+    def to_dict(self) -> dict:
+        return self._data
+
+
+# Shared by every sample; main.py only serializes it, never mutates it. A
+# plain dict rather than MappingProxyType so json.dumps still accepts it
+_METADATA = {
+    "tcp_host": "192.168.99.93",
+    "tcp_port": 26,
+    "request_timestamp": 1755853536.656231,
+    "response_timestamp": 1755853540.280509,
+    "response_time_ms": 3624.28,
+}
+
+_VOLTAGE_DICT = {
+    "cell_voltages": [3.272, 3.274, 3.273, 3.276],
+    "cell_count_in_packet": 4,
+    "temp_probe_count": 6,
+    "total_system_cells": 4,
+    "_metadata": _METADATA,
+}
+
+
+_CURRENT_DICT = {
+    "status_flags": {
+        "discharge_active": False,
+        "charge_active": False,
+        "mos_temp_present": True,
+        "ambient_temp_present": True,
+    },
+    "current": 0.0,
+    "overvoltage_protection": {
+        "cell_ov": False,
+        "pack_ov": False,
+        "full_charge_protection": False,
+    },
+    "undervoltage_protection": {"cell_uv": False, "pack_uv": False},
+    "temperature_protection": {
+        "charge_temp": False,
+        "discharge_temp": False,
+        "mos_over_temp": False,
+        "high_temp": False,
+        "low_temp": False,
+    },
+    "general_protection": {
+        "discharge_short_circuit": False,
+        "discharge_oc": False,
+        "charge_oc": False,
+        "ambient_high_temp": False,
+        "ambient_low_temp": False,
+    },
+    "temp_probe_count": 6,
+    "temperatures": [21.0, 22.0, 21.0, 21.0, 22.0, 21.0],
+    "software_version": 0,
+    "mos_state": {"discharge_mos_on": False, "charge_mos_on": False},
+    "failure_status": {
+        "temp_acquisition_fail": False,
+        "voltage_acquisition_fail": False,
+        "discharge_mos_fail": False,
+        "charge_mos_fail": False,
+    },
+    "_metadata": _METADATA,
+}
+
+
+_CAPACITY_DICT = {
+    "soc": 96,
+    "cycle_count": 0,
+    "design_capacity_high": 1,
+    "design_capacity_low": 34464,
+    "full_charge_capacity_high": 1,
+    "full_charge_capacity_low": 34464,
+    "remaining_capacity_high": 1,
+    "remaining_capacity_low": 30454,
+    "remaining_discharge_time": 65535,
+    "remaining_charge_time": 65535,
+    "charge_interval_current": 0,
+    "charge_interval_max": 0,
+    "pack_voltage": 74.36,
+    "max_cell_voltage": 52.236,
+    "min_cell_voltage": 51.213,
+    "hardware_version": 0,
+    "scheme_id": 0,
+    "reserved": "000000",
+    "_metadata": _METADATA,
+}
+
+
+_SERIAL_DICT = {
+    "serial_number": "ORN1000-TEST-001",
+    "_metadata": _METADATA,
+}
+
+
 @pytest.fixture
 def mock_transport() -> Mock:
     """Create a mock transport for testing."""
@@ -28,153 +131,66 @@ def mock_client(mock_transport) -> Mock:
     return client
 
 
-@pytest.fixture
-def sample_voltage_response() -> Mock:
+@pytest.fixture(scope="module")
+def sample_voltage_response() -> _StubResponse:
     """Sample voltage response data."""
-    response = Mock()
-    response.to_dict.return_value = {
-        "cell_voltages": [3.272, 3.274, 3.273, 3.276],
-        "cell_count_in_packet": 4,
-        "temp_probe_count": 6,
-        "total_system_cells": 4,
-        "_metadata": {
-            "tcp_host": "192.168.99.93",
-            "tcp_port": 26,
-            "request_timestamp": 1755853536.656231,
-            "response_timestamp": 1755853540.280509,
-            "response_time_ms": 3624.28,
-        },
-    }
-    return response
+    return _StubResponse(_VOLTAGE_DICT)
 
 
-@pytest.fixture
-def sample_current_response() -> Mock:
+@pytest.fixture(scope="module")
+def sample_current_response() -> _StubResponse:
     """Sample current status response data."""
-    response = Mock()
-    response.to_dict.return_value = {
-        "status_flags": {
-            "discharge_active": False,
-            "charge_active": False,
-            "mos_temp_present": True,
-            "ambient_temp_present": True,
-        },
-        "current": 0.0,
-        "overvoltage_protection": {
-            "cell_ov": False,
-            "pack_ov": False,
-            "full_charge_protection": False,
-        },
-        "undervoltage_protection": {"cell_uv": False, "pack_uv": False},
-        "temperature_protection": {
-            "charge_temp": False,
-            "discharge_temp": False,
-            "mos_over_temp": False,
-            "high_temp": False,
-            "low_temp": False,
-        },
-        "general_protection": {
-            "discharge_short_circuit": False,
-            "discharge_oc": False,
-            "charge_oc": False,
-            "ambient_high_temp": False,
-            "ambient_low_temp": False,
-        },
-        "temp_probe_count": 6,
-        "temperatures": [21.0, 22.0, 21.0, 21.0, 22.0, 21.0],
-        "software_version": 0,
-        "mos_state": {"discharge_mos_on": False, "charge_mos_on": False},
-        "failure_status": {
-            "temp_acquisition_fail": False,
-            "voltage_acquisition_fail": False,
-            "discharge_mos_fail": False,
-            "charge_mos_fail": False,
-        },
-        "_metadata": {
-            "tcp_host": "192.168.99.93",
-            "tcp_port": 26,
-            "request_timestamp": 1755853541.2893949,
-            "response_timestamp": 1755853541.6186528,
-            "response_time_ms": 329.26,
-        },
-    }
-    return response
+    return _StubResponse(_CURRENT_DICT)
 
 
-@pytest.fixture
-def sample_capacity_response() -> dict:
+@pytest.fixture(scope="module")
+def sample_capacity_response() -> _StubResponse:
     """Sample capacity status response data."""
-    response = Mock()
-    response.to_dict.return_value = {
-        "soc": 96,
-        "cycle_count": 0,
-        "design_capacity_high": 1,
-        "design_capacity_low": 34464,
-        "full_charge_capacity_high": 1,
-        "full_charge_capacity_low": 34464,
-        "remaining_capacity_high": 1,
-        "remaining_capacity_low": 30454,
-        "remaining_discharge_time": 65535,
-        "remaining_charge_time": 65535,
-        "charge_interval_current": 0,
-        "charge_interval_max": 0,
-        "pack_voltage": 74.36,
-        "max_cell_voltage": 52.236,
-        "min_cell_voltage": 51.213,
-        "hardware_version": 0,
-        "scheme_id": 0,
-        "reserved": "000000",
-        "_metadata": {
-            "tcp_host": "192.168.99.93",
-            "tcp_port": 26,
-            "request_timestamp": 1755853570.954936,
-            "response_timestamp": 1755853571.256609,
-            "response_time_ms": 301.67,
-        },
-    }
-    return response
+    return _StubResponse(_CAPACITY_DICT)
 
 
-@pytest.fixture
-def sample_serial_response() -> Mock:
+@pytest.fixture(scope="module")
+def sample_serial_response() -> _StubResponse:
     """Sample serial number response data."""
-    response = Mock()
-    response.to_dict.return_value = {
-        "serial_number": "ORN1000-TEST-001",
-        "_metadata": {
-            "tcp_host": "192.168.99.93",
-            "tcp_port": 26,
-            "request_timestamp": 1755853572.2628732,
-            "response_timestamp": 1755853572.509866,
-            "response_time_ms": 246.99,
-        },
-    }
-    return response
+    return _StubResponse(_SERIAL_DICT)
+
+
+@pytest.fixture
+def main_env(monkeypatch) -> SimpleNamespace:
+    """Stub main's transport and client classes and capture printed lines."""
+    printed: list[str] = []
+    transport_class = Mock()
+    client_class = Mock()
+
+    monkeypatch.setattr(main, "TcpTransport", transport_class)
+    monkeypatch.setattr(main, "BmsClient", client_class)
+    monkeypatch.setattr(
+        "builtins.print",
+        lambda *args, **kwargs: printed.append(" ".join(map(str, args))),
+    )
+
+    return SimpleNamespace(
+        transport_class=transport_class,
+        transport=transport_class.return_value,
+        client_class=client_class,
+        client=client_class.return_value,
+        printed=printed,
+    )
 
 
 class TestMainDemo:
     """Demo tests for main.py functionality."""
 
-    @patch("main.TcpTransport")
-    @patch("main.BmsClient")
-    @patch("builtins.print")
     def test_successful_data_collection(
         self,
-        mock_print,
-        mock_bms_client_class,
-        mock_tcp_transport_class,
+        main_env,
         sample_voltage_response,
         sample_current_response,
         sample_capacity_response,
         sample_serial_response,
     ) -> None:
         """Test successful collection of all BMS data."""
-        # Setup mocks
-        mock_transport = Mock()
-        mock_tcp_transport_class.return_value = mock_transport
-
-        mock_client = Mock()
-        mock_bms_client_class.return_value = mock_client
+        mock_client = main_env.client
 
         # Configure client method returns
         mock_client.read_voltage_data.return_value = sample_voltage_response
@@ -193,7 +209,7 @@ class TestMainDemo:
             main.main()
 
         # Verify transport was created with correct parameters
-        mock_tcp_transport_class.assert_called_once_with(
+        main_env.transport_class.assert_called_once_with(
             host="192.168.99.93",
             port=26,
             connection_strategy="per_request",
@@ -202,7 +218,9 @@ class TestMainDemo:
         )
 
         # Verify client was created
-        mock_bms_client_class.assert_called_once_with(mock_transport, address=0x01)
+        main_env.client_class.assert_called_once_with(
+            main_env.transport, address=0x01
+        )
 
         # Verify all commands were called
         mock_client.read_voltage_data.assert_called_once()
@@ -214,11 +232,7 @@ class TestMainDemo:
         mock_client.close.assert_called_once()
 
         # Verify output contains expected elements
-        print_calls = [
-            str(call.args[0]) if call.args else str(call)
-            for call in mock_print.call_args_list
-        ]
-        output_text = "\n".join(print_calls)
+        output_text = "\n".join(main_env.printed)
 
         assert "=== Orion 1000 BMS Data Collection ===" in output_text
         assert "Connected to: 192.168.99.93:26" in output_text
@@ -229,24 +243,14 @@ class TestMainDemo:
         assert "=== Complete BMS Data (JSON) ===" in output_text
         assert "=== Summary ===" in output_text
 
-    @patch("main.TcpTransport")
-    @patch("main.BmsClient")
-    @patch("builtins.print")
     def test_partial_failure_handling(
         self,
-        mock_print,
-        mock_bms_client_class,
-        mock_tcp_transport_class,
+        main_env,
         sample_voltage_response,
         sample_current_response,
     ) -> None:
         """Test handling of partial command failures."""
-        # Setup mocks
-        mock_transport = Mock()
-        mock_tcp_transport_class.return_value = mock_transport
-
-        mock_client = Mock()
-        mock_bms_client_class.return_value = mock_client
+        mock_client = main_env.client
 
         # Configure some successes and some failures
         mock_client.read_voltage_data.return_value = sample_voltage_response
@@ -261,11 +265,7 @@ class TestMainDemo:
         mock_client.close.assert_called_once()
 
         # Verify output contains both successes and failures
-        print_calls = [
-            str(call.args[0]) if call.args else str(call)
-            for call in mock_print.call_args_list
-        ]
-        output_text = "\n".join(print_calls)
+        output_text = "\n".join(main_env.printed)
 
         assert "✓ Voltage Data collected successfully" in output_text
         assert "✓ Current Status collected successfully" in output_text
@@ -274,19 +274,9 @@ class TestMainDemo:
             "✗ Failed to read Serial Number: Serial number read failed" in output_text
         )
 
-    @patch("main.TcpTransport")
-    @patch("main.BmsClient")
-    @patch("builtins.print")
-    def test_connection_error_handling(
-        self, mock_print, mock_bms_client_class, mock_tcp_transport_class
-    ) -> None:
+    def test_connection_error_handling(self, main_env) -> None:
         """Test handling of connection errors."""
-        # Setup mocks
-        mock_transport = Mock()
-        mock_tcp_transport_class.return_value = mock_transport
-
-        mock_client = Mock()
-        mock_bms_client_class.return_value = mock_client
+        mock_client = main_env.client
 
         # Simulate connection error
         mock_client.read_voltage_data.side_effect = Exception("Connection timeout")
@@ -298,31 +288,13 @@ class TestMainDemo:
         mock_client.close.assert_called_once()
 
         # Verify error was handled
-        print_calls = [
-            str(call.args[0]) if call.args else str(call)
-            for call in mock_print.call_args_list
-        ]
-        output_text = "\n".join(print_calls)
+        output_text = "\n".join(main_env.printed)
 
         assert "✗ Failed to read Voltage Data: Connection timeout" in output_text
 
-    @patch("main.TcpTransport")
-    @patch("main.BmsClient")
-    @patch("builtins.print")
-    def test_json_output_format(
-        self,
-        mock_print,
-        mock_bms_client_class,
-        mock_tcp_transport_class,
-        sample_voltage_response,
-    ) -> None:
+    def test_json_output_format(self, main_env, sample_voltage_response) -> None:
         """Test that JSON output is properly formatted."""
-        # Setup mocks
-        mock_transport = Mock()
-        mock_tcp_transport_class.return_value = mock_transport
-
-        mock_client = Mock()
-        mock_bms_client_class.return_value = mock_client
+        mock_client = main_env.client
 
         # Configure minimal successful response
         mock_client.read_voltage_data.return_value = sample_voltage_response
@@ -333,15 +305,9 @@ class TestMainDemo:
         # Run main function
         main.main()
 
-        # Find JSON output in print calls
-        print_calls = [
-            str(call.args[0]) if call.args else str(call)
-            for call in mock_print.call_args_list
-        ]
-
         # Look for JSON in the output - it should be a single call with the JSON string
         json_text = None
-        for call_text in print_calls:
+        for call_text in main_env.printed:
             if call_text.strip().startswith("{") and "voltage_data" in call_text:
                 json_text = call_text
                 break
@@ -361,25 +327,15 @@ class TestMainDemo:
         assert "_metadata" in voltage_data
         assert voltage_data["cell_count_in_packet"] == 4
 
-    @patch("main.TcpTransport")
-    @patch("main.BmsClient")
-    @patch("builtins.print")
     def test_summary_calculations(
         self,
-        mock_print,
-        mock_bms_client_class,
-        mock_tcp_transport_class,
+        main_env,
         sample_voltage_response,
         sample_current_response,
         sample_serial_response,
     ) -> None:
         """Test summary calculations are correct."""
-        # Setup mocks
-        mock_transport = Mock()
-        mock_tcp_transport_class.return_value = mock_transport
-
-        mock_client = Mock()
-        mock_bms_client_class.return_value = mock_client
+        mock_client = main_env.client
 
         # Configure responses
         mock_client.read_voltage_data.return_value = sample_voltage_response
@@ -391,11 +347,7 @@ class TestMainDemo:
         main.main()
 
         # Verify summary calculations
-        print_calls = [
-            str(call.args[0]) if call.args else str(call)
-            for call in mock_print.call_args_list
-        ]
-        output_text = "\n".join(print_calls)
+        output_text = "\n".join(main_env.printed)
 
         # Check voltage calculation (3.272 + 3.274 + 3.273 + 3.276 = 13.095)
         assert "Total Pack Voltage: 13.10V" in output_text
@@ -1,12 +1,15 @@
 """Integration demo tests for main.py using fake BMS server."""
 
+import io
 import json
 import pytest
-import subprocess
-import sys
 import time
-from typing import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from typing import Any, Iterator, TextIO
 
+from orion1000_bms import BmsClient
+from orion1000_bms.transport.tcp import TcpTransport
 from tests.integration.fakes.fake_bms_server import FakeBmsServer
 
 
@@ -19,89 +22,113 @@ def fake_server() -> Iterator[FakeBmsServer]:
     server.stop()
 
 
-class TestMainIntegrationDemo:
-    """Integration demo tests for main.py."""
-
-    def test_main_with_fake_server(self, fake_server: FakeBmsServer) -> None:
-        """Test main.py against fake BMS server."""
-        # Create a temporary main script that uses the fake server
-        test_script = f"""
-import sys
-sys.path.insert(0, '/Users/mathewwerber/projects/orionv2/src')
-
-import json
-import logging
-from orion1000_bms import BmsClient
-from orion1000_bms.transport.tcp import TcpTransport
-
-def main():
-    logging.basicConfig(level=logging.WARNING)  # Reduce noise
-    
-    # Use fake server
-    host = "127.0.0.1"
-    port = {fake_server.port}
-    address = 0x01
-
+def _run_demo_against(port: int) -> dict[str, Any]:
+    """Run the main.py data collection flow against a local server."""
     transport = TcpTransport(
-        host=host, 
+        host="127.0.0.1",
         port=port,
         connection_strategy="per_request",
         buffer_settling_time=0.1,
-        read_timeout=3.0
+        read_timeout=3.0,
     )
-    client = BmsClient(transport, address=address)
+    client = BmsClient(transport, address=0x01)
 
     try:
-        results = {{}}
-        
+        results: dict[str, Any] = {}
+
         # Test voltage data
         try:
             voltage_data = client.read_voltage_data()
             results["voltage_data"] = voltage_data.to_dict()
             print("✓ Voltage Data collected successfully")
         except Exception as e:
-            results["voltage_data"] = {{"error": str(e)}}
-            print(f"✗ Failed to read Voltage Data: {{e}}")
-        
+            results["voltage_data"] = {"error": str(e)}
+            print(f"✗ Failed to read Voltage Data: {e}")
+
         # Test current status
         try:
             current_status = client.read_current_status()
             results["current_status"] = current_status.to_dict()
             print("✓ Current Status collected successfully")
         except Exception as e:
-            results["current_status"] = {{"error": str(e)}}
-            print(f"✗ Failed to read Current Status: {{e}}")
-        
+            results["current_status"] = {"error": str(e)}
+            print(f"✗ Failed to read Current Status: {e}")
+
         # Output JSON
         print("=== JSON OUTPUT ===")
         print(json.dumps(results, indent=2))
-        
+
         return results
-        
+
+    finally:
+        client.close()
+
+
+def _run_timeout_demo(port: int) -> bool:
+    """Request voltage data from a port nobody listens on."""
+    transport = TcpTransport(
+        host="127.0.0.1",
+        port=port,
+        connection_strategy="per_request",
+        read_timeout=1.0,  # Short timeout
+    )
+    client = BmsClient(transport, address=0x01)
+
+    try:
+        client.read_voltage_data()
+        print("ERROR: Should have failed")
+        return False
+    except Exception as e:
+        print(f"✓ Expected error caught: {type(e).__name__}")
+        return True
     finally:
         client.close()
 
-if __name__ == "__main__":
-    main()
-"""
 
-        # Write and execute test script
-        with open("/tmp/test_main_demo.py", "w") as f:
-            f.write(test_script)
+def _run_strategy(strategy: str, port: int, out: TextIO) -> float:
+    """Time three voltage/current request pairs with one connection strategy.
 
-        # Run the script
-        result = subprocess.run(
-            [sys.executable, "/tmp/test_main_demo.py"],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
+    Output goes to ``out`` rather than stdout so strategies can run on
+    separate threads without interleaving.
+    """
+    transport = TcpTransport(
+        host="127.0.0.1",
+        port=port,
+        connection_strategy=strategy,
+        read_timeout=3.0,
+    )
+    client = BmsClient(transport, address=0x01)
 
-        # Verify execution
-        assert result.returncode == 0, f"Script failed: {result.stderr}"
+    try:
+        start_time = time.time()
+
+        # Make multiple requests
+        for _ in range(3):
+            client.read_voltage_data()
+            client.read_current_status()
+
+        total_time = time.time() - start_time
+
+        print(f"Strategy: {strategy}", file=out)
+        print(f"Total time for 6 requests: {total_time:.2f}s", file=out)
+        print(f"Average per request: {total_time/6:.2f}s", file=out)
+
+        return total_time
+
+    finally:
+        client.close()
+
+
+class TestMainIntegrationDemo:
+    """Integration demo tests for main.py."""
+
+    def test_main_with_fake_server(self, fake_server: FakeBmsServer) -> None:
+        """Test main.py against fake BMS server."""
+        with redirect_stdout(io.StringIO()) as captured:
+            _run_demo_against(fake_server.port)
 
         # Verify output contains expected elements
-        output = result.stdout
+        output = captured.getvalue()
         assert "✓ Voltage Data collected successfully" in output
         assert "✓ Current Status collected successfully" in output
         assert "=== JSON OUTPUT ===" in output
@@ -132,127 +159,37 @@ if __name__ == "__main__":
 
     def test_main_timeout_handling(self):
         """Test main.py timeout handling with non-existent server."""
-        test_script = """
-import sys
-sys.path.insert(0, '/Users/mathewwerber/projects/orionv2/src')
-
-import logging
-from orion1000_bms import BmsClient
-from orion1000_bms.transport.tcp import TcpTransport
-
-def main():
-    logging.basicConfig(level=logging.WARNING)
-    
-    # Use non-existent server
-    host = "127.0.0.1"
-    port = 9999  # Non-existent port
-    address = 0x01
-
-    transport = TcpTransport(
-        host=host, 
-        port=port,
-        connection_strategy="per_request",
-        read_timeout=1.0  # Short timeout
-    )
-    client = BmsClient(transport, address=address)
-
-    try:
-        voltage_data = client.read_voltage_data()
-        print("ERROR: Should have failed")
-        return False
-    except Exception as e:
-        print(f"✓ Expected error caught: {type(e).__name__}")
-        return True
-    finally:
-        client.close()
-
-if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1)
-"""
-
-        with open("/tmp/test_timeout_demo.py", "w") as f:
-            f.write(test_script)
-
-        result = subprocess.run(
-            [sys.executable, "/tmp/test_timeout_demo.py"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
+        with redirect_stdout(io.StringIO()) as captured:
+            success = _run_timeout_demo(9999)  # Non-existent port
 
-        assert result.returncode == 0
-        assert "✓ Expected error caught:" in result.stdout
+        assert success
+        assert "✓ Expected error caught:" in captured.getvalue()
 
     def test_main_connection_strategy_comparison(self, fake_server: FakeBmsServer):
         """Test different connection strategies."""
         strategies = ["persistent", "per_request"]
         results = {}
 
-        for strategy in strategies:
-            test_script = f"""
-import sys
-sys.path.insert(0, '/Users/mathewwerber/projects/orionv2/src')
-
-import time
-import logging
-from orion1000_bms import BmsClient
-from orion1000_bms.transport.tcp import TcpTransport
-
-def main():
-    logging.basicConfig(level=logging.WARNING)
-    
-    host = "127.0.0.1"
-    port = {fake_server.port}
-    address = 0x01
-
-    transport = TcpTransport(
-        host=host, 
-        port=port,
-        connection_strategy="{strategy}",
-        read_timeout=3.0
-    )
-    client = BmsClient(transport, address=address)
-
-    try:
-        start_time = time.time()
-        
-        # Make multiple requests
-        for i in range(3):
-            voltage_data = client.read_voltage_data()
-            current_status = client.read_current_status()
-        
-        end_time = time.time()
-        total_time = end_time - start_time
-        
-        print(f"Strategy: {strategy}")
-        print(f"Total time for 6 requests: {{total_time:.2f}}s")
-        print(f"Average per request: {{total_time/6:.2f}}s")
-        
-        return total_time
-        
-    finally:
-        client.close()
-
-if __name__ == "__main__":
-    main()
-"""
-
-            with open(f"/tmp/test_strategy_{strategy}_demo.py", "w") as f:
-                f.write(test_script)
+        # The fake server serves one connection at a time, so each strategy
+        # gets its own server to run concurrently against
+        extra_server = FakeBmsServer()
+        extra_server.start()
+        ports = {"persistent": fake_server.port, "per_request": extra_server.port}
+        outputs = {s: io.StringIO() for s in strategies}
 
-            result = subprocess.run(
-                [sys.executable, f"/tmp/test_strategy_{strategy}_demo.py"],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-
-            assert (
-                result.returncode == 0
-            ), f"Strategy {strategy} failed: {result.stderr}"
+        try:
+            with ThreadPoolExecutor(max_workers=len(strategies)) as ex:
+                futs = {
+                    s: ex.submit(_run_strategy, s, ports[s], outputs[s])
+                    for s in strategies
+                }
+                for fut in futs.values():
+                    fut.result()
+        finally:
+            extra_server.stop()
 
-            output = result.stdout
+        for strategy in strategies:
+            output = outputs[strategy].getvalue()
             assert f"Strategy: {strategy}" in output
             assert "Total time for 6 requests:" in output
 
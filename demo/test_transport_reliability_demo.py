@@ -1,6 +1,7 @@
 """Demo tests for TCP transport reliability improvements."""
 
 import pytest
+import socket
 import time
 from unittest.mock import Mock, patch, MagicMock
 import serial
@@ -54,6 +55,81 @@ class TestTransportReliabilityDemo:
         mock_serial.is_open = False
         assert not transport._is_connection_alive()
 
+    def test_connection_health_detects_peer_close(self):
+        """Test a persistent connection is dropped once the peer closes it."""
+        local, remote = socket.socketpair()
+        try:
+            mock_serial = Mock()
+            mock_serial.is_open = True
+            mock_serial._socket = local
+
+            transport = TcpTransport("127.0.0.1", 1234)
+            transport._serial = mock_serial
+            transport._connection_time = time.monotonic()
+
+            # Pending data is not mistaken for a closed peer
+            remote.sendall(b'\xea')
+            assert transport._is_connection_alive()
+
+            remote.close()
+            local.recv(1)
+            assert not transport._is_connection_alive()
+        finally:
+            local.close()
+            remote.close()
+
+    @patch('serial.serial_for_url')
+    def test_connect_disables_nagle(self, mock_serial_for_url):
+        """Test new connections set TCP_NODELAY on the underlying socket."""
+        mock_serial = Mock()
+        mock_serial_for_url.return_value = mock_serial
+
+        transport = TcpTransport("127.0.0.1", 1234, buffer_settling_time=0)
+        transport.open_if_needed()
+
+        mock_serial._socket.setsockopt.assert_any_call(
+            socket.IPPROTO_TCP, socket.TCP_NODELAY, 1
+        )
+
+    @patch('serial.serial_for_url')
+    def test_connect_keeps_nagle_without_low_latency(self, mock_serial_for_url):
+        """Test low_latency=False leaves Nagle's algorithm enabled."""
+        mock_serial = Mock()
+        mock_serial_for_url.return_value = mock_serial
+
+        transport = TcpTransport(
+            "127.0.0.1", 1234, buffer_settling_time=0, low_latency=False
+        )
+        transport.open_if_needed()
+
+        options = [c.args[1] for c in mock_serial._socket.setsockopt.call_args_list]
+        assert socket.TCP_NODELAY not in options
+
+    @patch('serial.serial_for_url')
+    def test_connect_enables_keepalive(self, mock_serial_for_url):
+        """Test new connections turn on TCP keepalive probes."""
+        mock_serial = Mock()
+        mock_serial_for_url.return_value = mock_serial
+
+        transport = TcpTransport("127.0.0.1", 1234, buffer_settling_time=0)
+        transport.open_if_needed()
+
+        mock_serial._socket.setsockopt.assert_any_call(
+            socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1
+        )
+
+    def test_connection_without_age_limit_stays_alive(self):
+        """Test connections are not aged out unless an interval is set."""
+        mock_serial = Mock()
+        mock_serial.is_open = True
+
+        transport = TcpTransport("127.0.0.1", 1234)
+        transport._serial = mock_serial
+        transport._connection_time = time.monotonic() - 86400.0
+
+        assert transport.force_reconnect_interval is None
+        assert transport._is_connection_alive()
+
     @patch('serial.serial_for_url')
     def test_connection_age_timeout(self, mock_serial_for_url):
         """Test connection age-based reconnection."""
@@ -165,16 +241,33 @@ class TestTransportReliabilityDemo:
         with patch.object(transport, '_read_frame', return_value=b'response'):
             transport._send_request_impl(b'test_payload')
             
-            # Should clear input buffer twice (enhanced clearing)
-            assert mock_serial.reset_input_buffer.call_count == 2
-            assert mock_serial.reset_output_buffer.call_count == 1
+            # Single input drain; output reset and flush are no-ops on socket://
+            assert mock_serial.reset_input_buffer.call_count == 1
+            mock_serial.reset_output_buffer.assert_not_called()
+            mock_serial.flush.assert_not_called()
+            mock_serial.write.assert_called_once_with(b'test_payload')
+
+    @patch('serial.serial_for_url')
+    def test_send_does_not_sleep_after_response(self, mock_serial_for_url):
+        """Test request spacing is left to the client, not the transport."""
+        mock_serial = Mock()
+        mock_serial.is_open = True
+        mock_serial_for_url.return_value = mock_serial
+
+        transport = TcpTransport("127.0.0.1", 1234, buffer_settling_time=0)
+
+        with patch.object(transport, '_read_frame', return_value=b'response'):
+            with patch('time.sleep') as mock_sleep:
+                assert transport._send_request_impl(b'test_payload') == b'response'
+
+        mock_sleep.assert_not_called()
 
     @patch('serial.serial_for_url')
     def test_connection_error_detection(self, mock_serial_for_url):
-        """Test connection error detection in _read_exact."""
+        """Test connection error detection in _read_into."""
         mock_serial = Mock()
         mock_serial.is_open = True
-        mock_serial.read.side_effect = ConnectionResetError("Connection broken")
+        mock_serial.readinto.side_effect = ConnectionResetError("Connection broken")
         mock_serial_for_url.return_value = mock_serial
         
         transport = TcpTransport("127.0.0.1", 1234)
@@ -182,22 +275,111 @@ class TestTransportReliabilityDemo:
         
         # Should detect and raise ConnectionResetError
         with pytest.raises(ConnectionResetError):
-            transport._read_exact(10)
+            transport._read_into(memoryview(bytearray(10)), timeout_s=1.0)
 
     @patch('serial.serial_for_url')
     def test_empty_read_detection(self, mock_serial_for_url):
-        """Test detection of too many empty reads."""
+        """Test an empty blocking read is reported as a timeout."""
         mock_serial = Mock()
         mock_serial.is_open = True
-        mock_serial.read.return_value = b''  # Always return empty
+        mock_serial.readinto.return_value = 0  # Port timed out with no data
         mock_serial_for_url.return_value = mock_serial
         
         transport = TcpTransport("127.0.0.1", 1234)
         transport._serial = mock_serial
         
-        # Should detect broken connection after too many empty reads
-        with pytest.raises(ConnectionResetError, match="Connection appears broken"):
-            transport._read_exact(10, timeout_s=1.0)
+        # The port waited out the deadline, so one empty read is a timeout
+        with pytest.raises(TimeoutError, match="got 0"):
+            transport._read_into(memoryview(bytearray(10)), timeout_s=1.0)
+        assert mock_serial.readinto.call_count == 1
+
+    @patch('serial.serial_for_url')
+    def test_peer_disconnect_detection(self, mock_serial_for_url):
+        """Test pyserial's disconnect error surfaces as ConnectionResetError."""
+        mock_serial = Mock()
+        mock_serial.is_open = True
+        mock_serial.readinto.side_effect = serial.SerialException(
+            "socket disconnected"
+        )
+        mock_serial_for_url.return_value = mock_serial
+
+        transport = TcpTransport("127.0.0.1", 1234)
+        transport._serial = mock_serial
+
+        with pytest.raises(ConnectionResetError, match="socket disconnected"):
+            transport._read_into(memoryview(bytearray(10)), timeout_s=1.0)
+
+    def test_read_into_blocks_instead_of_polling(self):
+        """Test _read_into blocks on the port timeout rather than sleeping."""
+        mock_serial = Mock()
+        mock_serial.timeout = 3.0
+        chunks = [b'\xea\xd1', b'\x01\x04']
+
+        def readinto(view):
+            chunk = chunks.pop(0)
+            view[:len(chunk)] = chunk
+            return len(chunk)
+
+        mock_serial.readinto.side_effect = readinto
+
+        transport = TcpTransport("127.0.0.1", 1234)
+        transport._serial = mock_serial
+
+        buf = bytearray(4)
+        with patch('time.sleep') as mock_sleep:
+            transport._read_into(memoryview(buf), timeout_s=1.0)
+        assert buf == b'\xea\xd1\x01\x04'
+
+        # No polling sleeps, and the configured port timeout is restored
+        mock_sleep.assert_not_called()
+        assert mock_serial.timeout == 3.0
+
+    def test_read_into_requests_all_remaining_bytes(self):
+        """Test each read asks the port for everything still outstanding."""
+        requested = []
+
+        def readinto(view):
+            requested.append(len(view))
+            # Deliver at most 6 bytes per call, as a fragmented TCP stream would
+            count = min(len(view), 6)
+            view[:count] = b'\x00' * count
+            return count
+
+        mock_serial = Mock()
+        mock_serial.readinto.side_effect = readinto
+
+        transport = TcpTransport("127.0.0.1", 1234)
+        transport._serial = mock_serial
+
+        transport._read_into(memoryview(bytearray(16)), timeout_s=1.0)
+        assert requested == [16, 10, 4]
+
+    def test_read_frame_reuses_receive_buffer(self):
+        """Test back-to-back frames of different sizes read into one buffer."""
+        from orion1000_bms.protocol.codec import build_frame
+
+        long_frame = build_frame(0x16, 0x01, 0xFF, 0x02, bytes(range(20)))
+        short_frame = build_frame(0x16, 0x01, 0xFF, 0x03, b'')
+        stream = bytearray(long_frame + short_frame)
+
+        def readinto(view):
+            count = len(view)
+            view[:] = stream[:count]
+            del stream[:count]
+            return count
+
+        mock_serial = Mock()
+        mock_serial.readinto.side_effect = readinto
+
+        transport = TcpTransport("127.0.0.1", 1234)
+        transport._serial = mock_serial
+
+        first = transport._read_frame(1.0)
+        second = transport._read_frame(1.0)
+
+        assert first == long_frame
+        assert second == short_frame
+        assert isinstance(first, bytes)
 
     def test_force_close_cleanup(self):
         """Test force close properly cleans up."""
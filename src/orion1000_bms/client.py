@@ -1,12 +1,14 @@
 """BMS client for synchronous communication."""
 
 from __future__ import annotations
+import contextlib
+import logging
 import threading
 import time
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, ContextManager, cast
 
 from .commands.base import BaseCommand, BaseResponse, ResponseBase, ResponseMetadata
-from .commands.registry import COMMANDS, CommandId
+from .commands.registry import COMMANDS, lookup_command
 from .commands import (
     VoltageRequest,
     VoltageResponse,
@@ -24,7 +26,7 @@ from .commands import (
 )
 from .exceptions import UnsupportedCommandError
 from .logging import get_logger
-from .protocol.codec import build_frame
+from .protocol.codec import build_frame, decode
 from .protocol.constants import PRODUCT_ID_DEFAULT, COMMAND_HIGH
 
 if TYPE_CHECKING:
@@ -41,6 +43,9 @@ class BmsClient:
         product_id: int = PRODUCT_ID_DEFAULT,
         address: int = 0x01,
         min_spacing_s: float = 1,
+        device_min_spacing_s: float = 0.1,
+        thread_safe: bool = True,
+        skip_redundant_mos: bool = False,
     ) -> None:
         """Initialize BMS client.
 
@@ -49,13 +54,37 @@ class BmsClient:
             product_id: BMS product ID
             address: BMS device address
             min_spacing_s: Minimum spacing between requests in seconds
+            device_min_spacing_s: Minimum spacing between commands within a
+                read_all() batch
+            thread_safe: Serialize requests with a lock. Pass False only when
+                a single thread ever uses the client, as in main.py
+            skip_redundant_mos: Skip MOS control commands that repeat the
+                state this client last set. Off by default: the BMS can
+                switch a MOS on its own (protection trip, reboot, another
+                client), so the cached state may be stale
         """
         self._transport = transport
         self._product_id = product_id
         self._address = address
         self._min_spacing_s = min_spacing_s
-        self._lock = threading.Lock()
-        self._last_request_time = 0.0
+        self._device_min_spacing_s = device_min_spacing_s
+        # Spacing is tracked in integer nanoseconds on perf_counter_ns
+        self._min_spacing_ns = int(min_spacing_s * 1e9)
+        self._device_min_spacing_ns = int(device_min_spacing_s * 1e9)
+        self._lock: ContextManager[Any] = (
+            threading.Lock() if thread_safe else contextlib.nullcontext()
+        )
+        # perf_counter_ns() value before which the next request must not be sent
+        self._next_allowed_ns = 0
+        # product_id and address are fixed for the client's lifetime, so a
+        # request without payload always encodes to the same frame
+        self._prebuilt: dict[int, bytes] = {
+            int(cmd_id): build_frame(product_id, address, COMMAND_HIGH, cmd_id, b"")
+            for cmd_id in COMMANDS
+        }
+        # Last MOS state this client commanded, keyed "charge"/"discharge"
+        self._skip_redundant_mos = skip_redundant_mos
+        self._mos_state: dict[str, bool] = {}
         self._logger = get_logger(__name__)
 
     def request(
@@ -75,91 +104,141 @@ class BmsClient:
             TransportError: On communication failure
         """
         with self._lock:
-            # Enforce minimum spacing
-            elapsed = time.time() - self._last_request_time
-            if elapsed < self._min_spacing_s:
-                time.sleep(self._min_spacing_s - elapsed)
-
-            # Look up command spec
-            try:
-                cmd_id = CommandId(req.command_id)
-            except ValueError:
-                self._logger.warning("Unknown command ID: 0x%04x", req.command_id)
-                raise UnsupportedCommandError(f"Unknown command: {req.command_id}")
-
-            if cmd_id not in COMMANDS:
-                self._logger.warning("Command not in registry: 0x%04x", req.command_id)
-                raise UnsupportedCommandError(f"Unknown command: {req.command_id}")
+            return self._request_locked(
+                req, timeout=timeout, spacing_ns=self._min_spacing_ns
+            )
+
+    def read_all(self, *, timeout: float | None = None) -> dict[str, BaseResponse]:
+        """Read voltage, current, capacity and serial number in one batch.
+
+        The batch holds the client lock throughout and spaces its commands by
+        the device's minimum inter-command delay; the client's own
+        min_spacing_s is only applied after the last command.
+
+        Args:
+            timeout: Optional timeout override for each command
+
+        Returns:
+            Responses keyed as in main.py: voltage_data, current_status,
+            capacity_status and serial_number
+        """
+        batch: tuple[tuple[str, BaseCommand], ...] = (
+            ("voltage_data", VoltageRequest()),
+            ("current_status", CurrentStatusRequest()),
+            ("capacity_status", CapacityStatusRequest()),
+            ("serial_number", SerialNumberRequest()),
+        )
+        results: dict[str, BaseResponse] = {}
+        with self._lock:
+            for i, (key, req) in enumerate(batch):
+                last = i == len(batch) - 1
+                results[key] = self._request_locked(
+                    req,
+                    timeout=timeout,
+                    spacing_ns=(
+                        self._min_spacing_ns if last else self._device_min_spacing_ns
+                    ),
+                )
+        return results
+
+    def _request_locked(
+        self, req: BaseCommand, *, timeout: float | None, spacing_ns: int
+    ) -> BaseResponse:
+        """Send one request; the caller must hold the client lock.
+
+        Args:
+            req: Command request to send
+            timeout: Optional timeout override
+            spacing_ns: Minimum delay in nanoseconds before the next request
 
+        Returns:
+            Parsed response object
+        """
+        # Enforce minimum spacing
+        delay_ns = self._next_allowed_ns - time.perf_counter_ns()
+        if delay_ns > 0:
+            time.sleep(delay_ns / 1e9)
+
+        # Look up command spec; CommandId is an IntEnum, so the raw int
+        # hashes to the same registry key without building the enum
+        spec = lookup_command(req.command_id)
+        if spec is None:
+            self._logger.warning("Unknown command ID: 0x%04x", req.command_id)
+            raise UnsupportedCommandError(f"Unknown command: {req.command_id}")
+
+        # Checked per request rather than cached so level changes apply
+        debug = self._logger.isEnabledFor(logging.DEBUG)
+        if debug:
             self._logger.debug(
                 "Sending command 0x%02x to address 0x%02x",
                 req.command_id,
                 self._address,
             )
 
-            spec = COMMANDS[cmd_id]
-
-            # Build request frame
-            cmd_hi = COMMAND_HIGH  # Always 0xFF
-            cmd_lo = req.command_id  # Command ID is now the low byte
-            payload = req.to_payload()
+        # Build request frame
+        cmd_hi = COMMAND_HIGH  # Always 0xFF
+        cmd_lo = req.command_id  # Command ID is now the low byte
+        payload = req.to_payload()
 
+        # Commands registered after this client was built have no prebuilt
+        # frame, so fall back to encoding them
+        request_frame = None if payload else self._prebuilt.get(cmd_lo)
+        if request_frame is None:
             request_frame = build_frame(
                 self._product_id, self._address, cmd_hi, cmd_lo, payload
             )
 
-            # Send request and get response with timing
-            request_timestamp = time.time()
-            response_bytes = self._transport.send_request(
-                request_frame, timeout=timeout
+        # Send request and get response with timing
+        request_timestamp = time.time()
+        response_bytes = self._transport.send_request(
+            request_frame, timeout=timeout
+        )
+        response_timestamp = time.time()
+        self._next_allowed_ns = time.perf_counter_ns() + spacing_ns
+
+        # Parse response
+        response_frame = decode(response_bytes)
+
+        # Verify response matches request
+        if (response_frame.cmd_hi != cmd_hi) or (response_frame.cmd_lo != cmd_lo):
+            self._logger.warning(
+                "Response command mismatch: expected 0x%02x%02x, got 0x%02x%02x",
+                cmd_hi,
+                cmd_lo,
+                response_frame.cmd_hi,
+                response_frame.cmd_lo,
             )
-            response_timestamp = time.time()
-
-            # Parse response
-            from .protocol.codec import decode
-
-            response_frame = decode(response_bytes)
-
-            # Verify response matches request
-            if (response_frame.cmd_hi != cmd_hi) or (response_frame.cmd_lo != cmd_lo):
-                self._logger.warning(
-                    "Response command mismatch: expected 0x%02x%02x, got 0x%02x%02x",
-                    cmd_hi,
-                    cmd_lo,
-                    response_frame.cmd_hi,
-                    response_frame.cmd_lo,
-                )
-                raise UnsupportedCommandError("Response command mismatch")
-
-            # Parse response payload (include command bytes in payload)
-            try:
-                full_payload = (
-                    bytes([response_frame.cmd_hi, response_frame.cmd_lo])
-                    + response_frame.payload
-                )
-                response = spec.resp.from_payload(full_payload)
-
-                # Set metadata on response
-                metadata = ResponseMetadata(
-                    tcp_host=getattr(self._transport, "host", "unknown"),
-                    tcp_port=getattr(self._transport, "port", 0),
-                    request_timestamp=request_timestamp,
-                    response_timestamp=response_timestamp,
-                )
-                cast(ResponseBase, response).set_metadata(metadata)
+            raise UnsupportedCommandError("Response command mismatch")
+
+        # Parse response payload (include command bytes in payload)
+        try:
+            # The command bytes and payload sit contiguously in the
+            # validated raw frame, between the header and checksum; parse
+            # them through a view rather than copying them out
+            full_payload = memoryview(response_bytes)[4:-2]
+            response = spec.resp.from_payload(full_payload)
+
+            # Set metadata on response
+            metadata = ResponseMetadata(
+                tcp_host=getattr(self._transport, "host", "unknown"),
+                tcp_port=getattr(self._transport, "port", 0),
+                request_timestamp=request_timestamp,
+                response_timestamp=response_timestamp,
+            )
+            cast(ResponseBase, response).set_metadata(metadata)
 
+            if debug:
                 self._logger.debug(
                     "Successfully processed command 0x%02x", req.command_id
                 )
-            except Exception as e:
-                self._logger.exception(
-                    "Failed to parse response payload for command 0x%02x",
-                    req.command_id,
-                )
-                raise
+        except Exception as e:
+            self._logger.exception(
+                "Failed to parse response payload for command 0x%02x",
+                req.command_id,
+            )
+            raise
 
-            self._last_request_time = time.time()
-            return response
+        return response
 
     def read_voltage_data(self, *, timeout: float | None = None) -> VoltageResponse:
         """Read all cell voltages and temperatures.
@@ -217,58 +296,129 @@ class BmsClient:
         resp = cast(SerialNumberResponse, self.request(req, timeout=timeout))
         return resp.serial_number
 
-    def allow_discharge(self, *, timeout: float | None = None) -> bool:
+    def allow_discharge(
+        self, *, timeout: float | None = None, force: bool = False
+    ) -> bool:
         """Allow discharge (open discharge MOS).
 
         Args:
             timeout: Optional timeout override
+            force: Send even if skip_redundant_mos is set and discharge was
+                already allowed by this client
 
         Returns:
             True if successful, False otherwise
         """
-        req = AllowDischargeRequest()
-        resp = cast(MosControlResponse, self.request(req, timeout=timeout))
-        return resp.success
+        return self._set_mos_state(
+            "discharge", True, AllowDischargeRequest(), timeout=timeout, force=force
+        )
 
-    def disallow_discharge(self, *, timeout: float | None = None) -> bool:
+    def disallow_discharge(
+        self, *, timeout: float | None = None, force: bool = False
+    ) -> bool:
         """Disallow discharge (close discharge MOS).
 
         Args:
             timeout: Optional timeout override
+            force: Send even if skip_redundant_mos is set and discharge was
+                already disallowed by this client
 
         Returns:
             True if successful, False otherwise
         """
-        req = DisallowDischargeRequest()
-        resp = cast(MosControlResponse, self.request(req, timeout=timeout))
-        return resp.success
-
-    def allow_charge(self, *, timeout: float | None = None) -> bool:
+        return self._set_mos_state(
+            "discharge",
+            False,
+            DisallowDischargeRequest(),
+            timeout=timeout,
+            force=force,
+        )
+
+    def allow_charge(
+        self, *, timeout: float | None = None, force: bool = False
+    ) -> bool:
         """Allow charge.
 
         Args:
             timeout: Optional timeout override
+            force: Send even if skip_redundant_mos is set and charge was
+                already allowed by this client
 
         Returns:
             True if successful, False otherwise
         """
-        req = AllowChargeRequest()
-        resp = cast(MosControlResponse, self.request(req, timeout=timeout))
-        return resp.success
+        return self._set_mos_state(
+            "charge", True, AllowChargeRequest(), timeout=timeout, force=force
+        )
 
-    def disallow_charge(self, *, timeout: float | None = None) -> bool:
+    def disallow_charge(
+        self, *, timeout: float | None = None, force: bool = False
+    ) -> bool:
         """Disallow charge.
 
         Args:
             timeout: Optional timeout override
+            force: Send even if skip_redundant_mos is set and charge was
+                already disallowed by this client
 
         Returns:
             True if successful, False otherwise
         """
-        req = DisallowChargeRequest()
-        resp = cast(MosControlResponse, self.request(req, timeout=timeout))
-        return resp.success
+        return self._set_mos_state(
+            "charge", False, DisallowChargeRequest(), timeout=timeout, force=force
+        )
+
+    def _set_mos_state(
+        self,
+        key: str,
+        allowed: bool,
+        req: BaseCommand,
+        *,
+        timeout: float | None,
+        force: bool,
+    ) -> bool:
+        """Send a MOS control command, optionally skipping a repeat.
+
+        With skip_redundant_mos set, a command that repeats the state this
+        client last set successfully is not sent. The cache only reflects
+        commands this client has sent; the BMS can still switch a MOS on
+        its own, so pass force=True when the device state must be
+        reasserted. The check, request and cache update happen under the
+        client lock.
+
+        Args:
+            key: "charge" or "discharge"
+            allowed: Target state for that MOS
+            req: Control request to send
+            timeout: Optional timeout override
+            force: Send even if the cached state already matches
+
+        Returns:
+            True if successful or skipped as already in the requested state
+        """
+        with self._lock:
+            if (
+                self._skip_redundant_mos
+                and not force
+                and self._mos_state.get(key) == allowed
+            ):
+                if self._logger.isEnabledFor(logging.DEBUG):
+                    self._logger.debug("Skipping redundant %s MOS command", key)
+                return True
+
+            resp = cast(
+                MosControlResponse,
+                self._request_locked(
+                    req, timeout=timeout, spacing_ns=self._min_spacing_ns
+                ),
+            )
+            if resp.success:
+                self._mos_state[key] = allowed
+            else:
+                self._mos_state.pop(key, None)
+            return resp.success
 
     def close(self) -> None:
         """Close the transport connection."""
+        self._mos_state.clear()
         self._transport.close()
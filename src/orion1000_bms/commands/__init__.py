@@ -13,6 +13,7 @@ from .current_status_request import CurrentStatusRequest, CurrentStatusResponse
 from .capacity_status_request import CapacityStatusRequest, CapacityStatusResponse
 from .serial_number_request import SerialNumberRequest, SerialNumberResponse
 from .mos_control import (
+    MosControlRequest,
     AllowDischargeRequest,
     DisallowDischargeRequest,
     AllowChargeRequest,
@@ -31,6 +32,7 @@ __all__ = [
     "CurrentStatusResponse",
     "SerialNumberRequest",
     "SerialNumberResponse",
+    "MosControlRequest",
     "AllowDischargeRequest",
     "DisallowDischargeRequest",
     "AllowChargeRequest",
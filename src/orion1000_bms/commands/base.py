@@ -1,8 +1,9 @@
 """Base command and response protocols."""
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, asdict
-from typing import Protocol, Type, Dict, Any, Optional, cast
+from dataclasses import dataclass, field, fields
+from functools import cache
+from typing import Protocol, Type, Dict, Any, Optional, get_origin, get_type_hints
 import logging
 from enum import IntEnum
 import time
@@ -19,6 +20,16 @@ class BaseCommand(Protocol):
         ...
 
 
+class EmptyPayloadMixin:
+    """Mixin for requests that carry no payload beyond the command bytes."""
+
+    __slots__ = ()
+
+    def to_payload(self) -> bytes:
+        """Convert to payload bytes (always empty)."""
+        return b""
+
+
 @dataclass(slots=True, frozen=True)
 class ResponseMetadata:
     """Metadata for BMS responses."""
@@ -27,6 +38,15 @@ class ResponseMetadata:
     tcp_port: int
     request_timestamp: float
     response_timestamp: float
+    response_time_ms: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Compute the round-trip time once from the timestamps."""
+        object.__setattr__(
+            self,
+            "response_time_ms",
+            round((self.response_timestamp - self.request_timestamp) * 1000, 2),
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert metadata to dictionary."""
@@ -35,14 +55,43 @@ class ResponseMetadata:
             "tcp_port": self.tcp_port,
             "request_timestamp": self.request_timestamp,
             "response_timestamp": self.response_timestamp,
-            "response_time_ms": round(
-                (self.response_timestamp - self.request_timestamp) * 1000, 2
-            ),
+            "response_time_ms": self.response_time_ms,
         }
 
 
+@cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    """Return the dataclass field names of a response class, computed once."""
+    return tuple(f.name for f in fields(cls))
+
+
+@cache
+def _bytes_field_names(cls: type) -> tuple[str, ...]:
+    """Return the names of bytes-typed fields, hex encoded by to_dict."""
+    hints = get_type_hints(cls)
+    return tuple(name for name in _field_names(cls) if hints[name] is bytes)
+
+
+@cache
+def _container_field_names(cls: type) -> tuple[str, ...]:
+    """Return the names of dict and list fields, copied by to_dict."""
+    hints = get_type_hints(cls)
+    return tuple(
+        name
+        for name in _field_names(cls)
+        if (get_origin(hints[name]) or hints[name]) in (dict, list)
+    )
+
+
 class ResponseBase:
-    """Base class for BMS command responses with validation and JSON serialization."""
+    """Base class for BMS command responses with validation and JSON serialization.
+
+    Subclasses are expected to be dataclasses; to_dict() serializes their
+    fields.
+    """
+
+    # Metadata lives in a declared slot so slotted subclasses need no __dict__
+    __slots__ = ("_metadata",)
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
         super().__init_subclass__(**kwargs)
@@ -58,33 +107,35 @@ class ResponseBase:
         return getattr(self, "_metadata", None)
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert response to JSON-serializable dictionary."""
-        # Use asdict if this is a dataclass, otherwise create dict manually
-        if hasattr(self, "__dataclass_fields__"):
-            # Cast to Any to avoid mypy issues with asdict
-            result = asdict(cast(Any, self))
-        else:
-            # Fallback for non-dataclass responses
-            result = {k: v for k, v in self.__dict__.items() if not k.startswith("_")}
+        """Convert response to JSON-serializable dictionary.
+
+        List and dict fields are copied one level deep, unlike
+        dataclasses.asdict(). Every such field on the built-in responses
+        holds only floats, ints or bools, so the result shares no mutable
+        state with the response. A subclass that nests containers inside
+        them must copy those itself.
+        """
+        # Responses are dataclasses; read fields directly. Annotated as a
+        # plain type so it matches the cached helpers' signatures.
+        cls: type = type(self)
+        result = {name: getattr(self, name) for name in _field_names(cls)}
+        for name in _container_field_names(cls):
+            value = result[name]
+            result[name] = list(value) if isinstance(value, list) else dict(value)
+        # Convert bytes fields to hex strings for JSON serialization
+        for name in _bytes_field_names(cls):
+            result[name] = result[name].hex()
 
         # Add metadata if available
         if self.metadata:
             result["_metadata"] = self.metadata.to_dict()
 
-        # Convert bytes fields to hex strings for JSON serialization
-        def convert_bytes(obj: Any) -> Any:
-            if isinstance(obj, bytes):
-                return obj.hex()
-            elif isinstance(obj, dict):
-                return {k: convert_bytes(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [convert_bytes(item) for item in obj]
-            return obj
-
-        return convert_bytes(result)
+        return result
 
     @classmethod
-    def validate_payload_length(cls, payload: bytes, expected_data_bytes: int) -> None:
+    def validate_payload_length(
+        cls, payload: bytes | memoryview, expected_data_bytes: int
+    ) -> None:
         """Validate payload has expected length based on protocol.
 
         Args:
@@ -99,7 +150,7 @@ class ResponseBase:
 
     @classmethod
     def validate_minimum_payload_length(
-        cls, payload: bytes, min_data_bytes: int
+        cls, payload: bytes | memoryview, min_data_bytes: int
     ) -> None:
         """Validate payload has minimum required length for variable-length responses.
 
@@ -118,11 +169,13 @@ class BaseResponse(Protocol):
     """Protocol for BMS command responses."""
 
     @classmethod
-    def from_payload(cls, payload: bytes) -> "BaseResponse":
+    def from_payload(cls, payload: bytes | memoryview) -> "BaseResponse":
         """Parse response from payload bytes.
 
         Args:
-            payload: Complete payload including command bytes and data
+            payload: Complete payload including command bytes and data; may
+                be a memoryview into the received frame, so implementations
+                must copy anything they keep
         """
         ...
 
@@ -2,26 +2,48 @@
 
 from __future__ import annotations
 import logging
+import struct
 from dataclasses import dataclass
 from typing import Dict, Any
-from .registry import CommandId, COMMANDS
-from .base import CommandSpec, ResponseBase
-from .parsing_utils import parse_big_endian_uint16, parse_tagged_data
+from .registry import CommandId, register_command
+from .base import CommandSpec, EmptyPayloadMixin, ResponseBase
+from .parsing_utils import parse_tagged_values
 
 logger = logging.getLogger(__name__)
 
+# Tagged section (bytes 7-36 in spec): tag -> (field position, byte count)
+_TAGS = {
+    0x01: (0, 1),  # soc
+    0x02: (1, 2),  # cycle_count
+    0x03: (2, 2),  # design_capacity_high
+    0x04: (3, 2),  # design_capacity_low
+    0x05: (4, 2),  # full_charge_capacity_high
+    0x06: (5, 2),  # full_charge_capacity_low
+    0x07: (6, 2),  # remaining_capacity_high
+    0x08: (7, 2),  # remaining_capacity_low
+    0x09: (8, 2),  # remaining_discharge_time
+    0x0A: (9, 2),  # remaining_charge_time
+    0x0B: (10, 12),  # charge_interval: current interval, max interval
+    0x0D: (11, 1),  # hardware_version
+}
+_TAG_DEFAULTS = (0,) * 10 + (b"\x00" * 12, 0)
+
+# Pack, max cell and min cell voltage, then the hardware version byte
+# (already read from the tags), at byte 48 in spec
+_FIXED_TAIL = struct.Struct(">HHHx")
+_FIXED_TAIL_OFFSET = 42
+
+# Leading current/max interval pair of the 12-byte charge interval tag
+_CHARGE_INTERVAL = struct.Struct(">HH")
+
 
 @dataclass(slots=True)
-class CapacityStatusRequest:
+class CapacityStatusRequest(EmptyPayloadMixin):
     """Request to read capacity and status information."""
 
     command_id: int = CommandId.CAPACITY_STATUS_REQUEST
     address: int = 0x01
 
-    def to_payload(self) -> bytes:
-        """Convert to payload bytes (empty for capacity status request)."""
-        return b""
-
 
 @dataclass(slots=True, frozen=True)
 class CapacityStatusResponse(ResponseBase):
@@ -47,7 +69,7 @@ class CapacityStatusResponse(ResponseBase):
     reserved: bytes  # Reserved bytes
 
     @classmethod
-    def from_payload(cls, payload: bytes) -> CapacityStatusResponse:
+    def from_payload(cls, payload: bytes | memoryview) -> CapacityStatusResponse:
         """Parse capacity and status data from payload bytes.
 
         Args:
@@ -61,90 +83,60 @@ class CapacityStatusResponse(ResponseBase):
             payload, 49
         )  # Adjusted based on actual BMS response
 
-        # Skip command bytes (first 2 bytes)
-        data = payload[2:]
-
-        # Parse tagged data section (bytes 7-36 in spec)
-        tag_map = {
-            0x01: ("soc", 1),
-            0x02: ("cycle_count", 2),
-            0x03: ("design_capacity_high", 2),
-            0x04: ("design_capacity_low", 2),
-            0x05: ("full_charge_capacity_high", 2),
-            0x06: ("full_charge_capacity_low", 2),
-            0x07: ("remaining_capacity_high", 2),
-            0x08: ("remaining_capacity_low", 2),
-            0x09: ("remaining_discharge_time", 2),
-            0x0A: ("remaining_charge_time", 2),
-            0x0B: ("charge_interval", 12),  # 2 values: current interval, max interval
-            0x0D: ("hardware_version", 1),
-        }
+        # Skip command bytes (first 2 bytes) without copying the rest
+        data = memoryview(payload)[2:]
 
         # Parse tagged section (first 30 bytes of data)
-        tagged_data = parse_tagged_data(data[:30], tag_map)
-
-        # Extract values with defaults
-        soc = tagged_data.get("soc", 0)
-        cycle_count = tagged_data.get("cycle_count", 0)
-        design_capacity_high = tagged_data.get("design_capacity_high", 0)
-        design_capacity_low = tagged_data.get("design_capacity_low", 0)
-        full_charge_capacity_high = tagged_data.get("full_charge_capacity_high", 0)
-        full_charge_capacity_low = tagged_data.get("full_charge_capacity_low", 0)
-        remaining_capacity_high = tagged_data.get("remaining_capacity_high", 0)
-        remaining_capacity_low = tagged_data.get("remaining_capacity_low", 0)
-        remaining_discharge_time = tagged_data.get("remaining_discharge_time", 0)
-        remaining_charge_time = tagged_data.get("remaining_charge_time", 0)
-        hardware_version = tagged_data.get("hardware_version", 0)
-
-        # Parse charge interval data (12 bytes)
-        charge_interval_data = tagged_data.get("charge_interval", b"\x00" * 12)
-        charge_interval_current = (
-            parse_big_endian_uint16(charge_interval_data, 0)
-            if len(charge_interval_data) >= 2
-            else 0
-        )
-        charge_interval_max = (
-            parse_big_endian_uint16(charge_interval_data, 2)
-            if len(charge_interval_data) >= 4
-            else 0
+        (
+            soc,
+            cycle_count,
+            design_capacity_high,
+            design_capacity_low,
+            full_charge_capacity_high,
+            full_charge_capacity_low,
+            remaining_capacity_high,
+            remaining_capacity_low,
+            remaining_discharge_time,
+            remaining_charge_time,
+            charge_interval_data,
+            hardware_version,
+        ) = parse_tagged_values(data[:30], _TAGS, _TAG_DEFAULTS)
+
+        # Parse charge interval data (12 bytes, zeros when the tag is absent)
+        charge_interval_current, charge_interval_max = _CHARGE_INTERVAL.unpack_from(
+            charge_interval_data
         )
 
-        # Parse fixed position fields (bytes 48-59 in spec)
-        offset = 42  # Skip to byte 48 equivalent in data
-        pack_voltage_raw = (
-            parse_big_endian_uint16(data, offset) if offset + 1 < len(data) else 0
+        # Parse fixed position fields (bytes 48-59 in spec). The minimum
+        # length check above guarantees pack voltage through hardware
+        # version, so only the scheme id and reserved bytes are optional.
+        pack_voltage_raw, max_cell_voltage_raw, min_cell_voltage_raw = (
+            _FIXED_TAIL.unpack_from(data, _FIXED_TAIL_OFFSET)
         )
         pack_voltage = pack_voltage_raw * 0.01  # Convert 10mV to V
-        offset += 2
-
-        max_cell_voltage_raw = (
-            parse_big_endian_uint16(data, offset) if offset + 1 < len(data) else 0
-        )
         max_cell_voltage = max_cell_voltage_raw * 0.001  # Convert 1mV to V
-        offset += 2
-
-        min_cell_voltage_raw = (
-            parse_big_endian_uint16(data, offset) if offset + 1 < len(data) else 0
-        )
         min_cell_voltage = min_cell_voltage_raw * 0.001  # Convert 1mV to V
-        offset += 2
 
         # Skip hardware version (already parsed from tags)
-        offset += 1
+        offset = _FIXED_TAIL_OFFSET + _FIXED_TAIL.size
+        data_len = len(data)
 
-        scheme_id = data[offset] if offset < len(data) else 0
+        scheme_id = data[offset] if offset < data_len else 0
         offset += 1
 
         # Reserved bytes
         reserved = (
-            data[offset : offset + 3] if offset + 2 < len(data) else b"\x00\x00\x00"
+            bytes(data[offset : offset + 3])
+            if offset + 2 < data_len
+            else b"\x00\x00\x00"
         )
 
-        logger.debug(
-            "Parsed capacity status response: SOC=%d%%, pack_voltage=%.2fV",
-            soc,
-            pack_voltage,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Parsed capacity status response: SOC=%d%%, pack_voltage=%.2fV",
+                soc,
+                pack_voltage,
+            )
 
         return cls(
             soc=soc,
@@ -169,6 +161,7 @@ class CapacityStatusResponse(ResponseBase):
 
 
 # Register command
-COMMANDS[CommandId.CAPACITY_STATUS_REQUEST] = CommandSpec(
-    req=CapacityStatusRequest, resp=CapacityStatusResponse
+register_command(
+    CommandId.CAPACITY_STATUS_REQUEST,
+    CommandSpec(req=CapacityStatusRequest, resp=CapacityStatusResponse),
 )
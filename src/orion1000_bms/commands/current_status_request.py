@@ -2,30 +2,71 @@
 
 from __future__ import annotations
 import logging
+import struct
 from dataclasses import dataclass
-from typing import List, Dict
-from .registry import CommandId, COMMANDS
-from .base import CommandSpec, ResponseBase
-from .parsing_utils import (
-    parse_big_endian_uint16,
-    parse_temperature,
-    extract_bitfield_flags,
-)
+from typing import Dict, List
+from .registry import CommandId, register_command
+from .base import CommandSpec, EmptyPayloadMixin, ResponseBase
+from .parsing_utils import make_bitfield_extractor
 
 logger = logging.getLogger(__name__)
 
+# Fixed head of the data section: status flags, current (10mA), OV, UV,
+# temperature and general protection, temperature probe count
+_HEAD = struct.Struct(">BHBBBBB")
+
+# Celsius for each raw temperature byte (actual temp + 40°C offset)
+_TEMPERATURES = tuple(float(raw - 40) for raw in range(256))
+
+# Flag extractors for each status byte, with bit masks computed once
+_STATUS_FLAGS = make_bitfield_extractor(
+    {
+        0: "discharge_active",
+        1: "charge_active",
+        4: "mos_temp_present",
+        5: "ambient_temp_present",
+    }
+)
+_OV_PROTECTION = make_bitfield_extractor(
+    {0: "cell_ov", 1: "pack_ov", 4: "full_charge_protection"}
+)
+_UV_PROTECTION = make_bitfield_extractor({0: "cell_uv", 1: "pack_uv"})
+_TEMP_PROTECTION = make_bitfield_extractor(
+    {
+        0: "charge_temp",
+        1: "discharge_temp",
+        2: "mos_over_temp",
+        4: "high_temp",
+        5: "low_temp",
+    }
+)
+_GENERAL_PROTECTION = make_bitfield_extractor(
+    {
+        0: "discharge_short_circuit",
+        1: "discharge_oc",
+        2: "charge_oc",
+        4: "ambient_high_temp",
+        5: "ambient_low_temp",
+    }
+)
+_MOS_STATE = make_bitfield_extractor({1: "discharge_mos_on", 2: "charge_mos_on"})
+_FAILURE_STATUS = make_bitfield_extractor(
+    {
+        0: "temp_acquisition_fail",
+        1: "voltage_acquisition_fail",
+        2: "discharge_mos_fail",
+        3: "charge_mos_fail",
+    }
+)
+
 
 @dataclass(slots=True)
-class CurrentStatusRequest:
+class CurrentStatusRequest(EmptyPayloadMixin):
     """Request to read current and status information."""
 
     command_id: int = CommandId.CURRENT_STATUS_REQUEST
     address: int = 0x01
 
-    def to_payload(self) -> bytes:
-        """Convert to payload bytes (empty for current status request)."""
-        return b""
-
 
 @dataclass(slots=True, frozen=True)
 class CurrentStatusResponse(ResponseBase):
@@ -44,7 +85,7 @@ class CurrentStatusResponse(ResponseBase):
     failure_status: Dict[str, bool]  # Failure status flags
 
     @classmethod
-    def from_payload(cls, payload: bytes) -> CurrentStatusResponse:
+    def from_payload(cls, payload: bytes | memoryview) -> CurrentStatusResponse:
         """Parse current and status data from payload bytes.
 
         Args:
@@ -56,107 +97,58 @@ class CurrentStatusResponse(ResponseBase):
         # Validate minimum payload length for fixed fields
         cls.validate_minimum_payload_length(payload, 8)  # Basic required fields
 
-        # Skip command bytes (first 2 bytes)
-        data = payload[2:]
+        # Skip command bytes (first 2 bytes) without copying the rest
+        data = memoryview(payload)[2:]
 
-        # Parse fields according to new spec (byte positions from spec table)
-        offset = 0
+        # Bytes 7-14 are fixed position; unpack them in one call
+        (
+            status_flags_raw,
+            current_raw,
+            ov_raw,
+            uv_raw,
+            temp_protection_raw,
+            general_protection_raw,
+            temp_probe_count,
+        ) = _HEAD.unpack_from(data)
+        offset = _HEAD.size
 
         # Byte 7: Status Flags
-        status_flags_raw = data[offset]
-        status_flags = extract_bitfield_flags(
-            status_flags_raw,
-            {
-                0: "discharge_active",
-                1: "charge_active",
-                4: "mos_temp_present",
-                5: "ambient_temp_present",
-            },
-        )
-        offset += 1
+        status_flags = _STATUS_FLAGS(status_flags_raw)
 
         # Bytes 8-9: Current Value (2 bytes, unsigned, 10mA units)
-        current_raw = parse_big_endian_uint16(data, offset)
         current = current_raw * 0.01  # Convert 10mA to A
-        offset += 2
 
-        # Byte 10: Over-voltage Protection Status
-        ov_protection = extract_bitfield_flags(
-            data[offset], {0: "cell_ov", 1: "pack_ov", 4: "full_charge_protection"}
-        )
-        offset += 1
+        # Bytes 10-13: Over-voltage, under-voltage, temperature and
+        # general protection status
+        ov_protection = _OV_PROTECTION(ov_raw)
+        uv_protection = _UV_PROTECTION(uv_raw)
+        temp_protection = _TEMP_PROTECTION(temp_protection_raw)
+        general_protection = _GENERAL_PROTECTION(general_protection_raw)
 
-        # Byte 11: Under-voltage Protection Status
-        uv_protection = extract_bitfield_flags(
-            data[offset], {0: "cell_uv", 1: "pack_uv"}
-        )
-        offset += 1
-
-        # Byte 12: Temperature Protection Status
-        temp_protection = extract_bitfield_flags(
-            data[offset],
-            {
-                0: "charge_temp",
-                1: "discharge_temp",
-                2: "mos_over_temp",
-                4: "high_temp",
-                5: "low_temp",
-            },
-        )
-        offset += 1
-
-        # Byte 13: General Protection Status
-        general_protection = extract_bitfield_flags(
-            data[offset],
-            {
-                0: "discharge_short_circuit",
-                1: "discharge_oc",
-                2: "charge_oc",
-                4: "ambient_high_temp",
-                5: "ambient_low_temp",
-            },
-        )
-        offset += 1
-
-        # Byte 14: Number of Temperature Probes
-        temp_probe_count = data[offset]
-        offset += 1
+        # Byte 14: Number of Temperature Probes (temp_probe_count)
 
         # Parse temperature data (N bytes, each = actual temp + 40°C offset)
-        temperatures = []
-        for i in range(temp_probe_count):
-            if offset < len(data):
-                temp_raw = data[offset]
-                temp = parse_temperature(temp_raw)
-                temperatures.append(temp)
-                offset += 1
+        temp_raw = data[offset : offset + temp_probe_count]
+        temperatures = [_TEMPERATURES[raw] for raw in temp_raw]
+        offset += len(temp_raw)
 
         # Parse remaining fields (variable position due to temperature data)
         software_version = data[offset] if offset < len(data) else 0
         offset += 1
 
         mos_state_raw = data[offset] if offset < len(data) else 0
-        mos_state = extract_bitfield_flags(
-            mos_state_raw, {1: "discharge_mos_on", 2: "charge_mos_on"}
-        )
+        mos_state = _MOS_STATE(mos_state_raw)
         offset += 1
 
         failure_status_raw = data[offset] if offset < len(data) else 0
-        failure_status = extract_bitfield_flags(
-            failure_status_raw,
-            {
-                0: "temp_acquisition_fail",
-                1: "voltage_acquisition_fail",
-                2: "discharge_mos_fail",
-                3: "charge_mos_fail",
-            },
-        )
+        failure_status = _FAILURE_STATUS(failure_status_raw)
 
-        logger.debug(
-            "Parsed current status response: current=%.2fA, %d temp probes",
-            current,
-            temp_probe_count,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Parsed current status response: current=%.2fA, %d temp probes",
+                current,
+                temp_probe_count,
+            )
 
         return cls(
             status_flags=status_flags,
@@ -174,6 +166,7 @@ class CurrentStatusResponse(ResponseBase):
 
 
 # Register command
-COMMANDS[CommandId.CURRENT_STATUS_REQUEST] = CommandSpec(
-    req=CurrentStatusRequest, resp=CurrentStatusResponse
+register_command(
+    CommandId.CURRENT_STATUS_REQUEST,
+    CommandSpec(req=CurrentStatusRequest, resp=CurrentStatusResponse),
 )
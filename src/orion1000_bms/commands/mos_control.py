@@ -3,58 +3,50 @@
 from __future__ import annotations
 import logging
 from dataclasses import dataclass
-from .registry import CommandId, COMMANDS
-from .base import CommandSpec, ResponseBase
+from .registry import CommandId, register_command
+from .base import CommandSpec, EmptyPayloadMixin, ResponseBase
 
 logger = logging.getLogger(__name__)
 
 
 @dataclass(slots=True)
-class AllowDischargeRequest:
-    """Request to allow discharge (open discharge MOS)."""
+class MosControlRequest(EmptyPayloadMixin):
+    """Base request to switch a charge or discharge MOS.
 
-    command_id: int = CommandId.ALLOW_DISCHARGE
+    The four MOS commands differ only in command_id; each subclass sets
+    its own as the default.
+    """
+
+    command_id: int
     address: int = 0x01
 
-    def to_payload(self) -> bytes:
-        """Convert to payload bytes (empty for MOS control)."""
-        return b""
+
+@dataclass(slots=True)
+class AllowDischargeRequest(MosControlRequest):
+    """Request to allow discharge (open discharge MOS)."""
+
+    command_id: int = CommandId.ALLOW_DISCHARGE
 
 
 @dataclass(slots=True)
-class DisallowDischargeRequest:
+class DisallowDischargeRequest(MosControlRequest):
     """Request to disallow discharge (close discharge MOS)."""
 
     command_id: int = CommandId.DISALLOW_DISCHARGE
-    address: int = 0x01
-
-    def to_payload(self) -> bytes:
-        """Convert to payload bytes (empty for MOS control)."""
-        return b""
 
 
 @dataclass(slots=True)
-class AllowChargeRequest:
+class AllowChargeRequest(MosControlRequest):
     """Request to allow charge."""
 
     command_id: int = CommandId.ALLOW_CHARGE
-    address: int = 0x01
-
-    def to_payload(self) -> bytes:
-        """Convert to payload bytes (empty for MOS control)."""
-        return b""
 
 
 @dataclass(slots=True)
-class DisallowChargeRequest:
+class DisallowChargeRequest(MosControlRequest):
     """Request to disallow charge."""
 
     command_id: int = CommandId.DISALLOW_CHARGE
-    address: int = 0x01
-
-    def to_payload(self) -> bytes:
-        """Convert to payload bytes (empty for MOS control)."""
-        return b""
 
 
 @dataclass(slots=True, frozen=True)
@@ -65,7 +57,7 @@ class MosControlResponse(ResponseBase):
     status: int  # Status byte (0x00 = success, other = failure)
 
     @classmethod
-    def from_payload(cls, payload: bytes) -> MosControlResponse:
+    def from_payload(cls, payload: bytes | memoryview) -> MosControlResponse:
         """Parse MOS control response from payload bytes.
 
         Args:
@@ -80,17 +72,19 @@ class MosControlResponse(ResponseBase):
         cls.validate_payload_length(payload, 0)
 
         # For successful MOS control, we get fixed acknowledgment
-        # Command bytes in payload are FF FF
-        cmd_hi = payload[0] if len(payload) > 0 else 0xFF
-        cmd_lo = payload[1] if len(payload) > 1 else 0xFF
-        command_id = cmd_lo
+        # Command bytes in payload are FF FF; the length check above
+        # guarantees both are present
+        command_id = payload[1]
 
         # Status is success if we get the fixed acknowledgment format
         status = 0x00  # Success
 
-        logger.debug(
-            "Parsed MOS control response: cmd=0x%02x, status=0x%02x", command_id, status
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Parsed MOS control response: cmd=0x%02x, status=0x%02x",
+                command_id,
+                status,
+            )
 
         return cls(command_id=command_id, status=status)
 
@@ -101,18 +95,22 @@ class MosControlResponse(ResponseBase):
 
 
 # Register commands
-COMMANDS[CommandId.ALLOW_DISCHARGE] = CommandSpec(
-    req=AllowDischargeRequest, resp=MosControlResponse
+register_command(
+    CommandId.ALLOW_DISCHARGE,
+    CommandSpec(req=AllowDischargeRequest, resp=MosControlResponse),
 )
 
-COMMANDS[CommandId.DISALLOW_DISCHARGE] = CommandSpec(
-    req=DisallowDischargeRequest, resp=MosControlResponse
+register_command(
+    CommandId.DISALLOW_DISCHARGE,
+    CommandSpec(req=DisallowDischargeRequest, resp=MosControlResponse),
 )
 
-COMMANDS[CommandId.ALLOW_CHARGE] = CommandSpec(
-    req=AllowChargeRequest, resp=MosControlResponse
+register_command(
+    CommandId.ALLOW_CHARGE,
+    CommandSpec(req=AllowChargeRequest, resp=MosControlResponse),
 )
 
-COMMANDS[CommandId.DISALLOW_CHARGE] = CommandSpec(
-    req=DisallowChargeRequest, resp=MosControlResponse
+register_command(
+    CommandId.DISALLOW_CHARGE,
+    CommandSpec(req=DisallowChargeRequest, resp=MosControlResponse),
 )
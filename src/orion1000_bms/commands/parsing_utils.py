@@ -1,11 +1,14 @@
 """Common parsing utilities for BMS command responses."""
 
 import struct
-from typing import Dict, Any, Tuple
+from typing import Callable, Dict, Any, List, Sequence, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Placeholder for tags parse_tagged_data did not find
+_ABSENT = object()
+
 
 def parse_temperature(raw_value: int) -> float:
     """Convert raw temperature value to Celsius.
@@ -48,6 +51,9 @@ def parse_big_endian_int16(data: bytes, offset: int) -> int:
 def extract_bitfield_flags(value: int, flag_map: Dict[int, str]) -> Dict[str, bool]:
     """Extract named flags from a bitfield value.
 
+    One-off form of make_bitfield_extractor; parsers that decode the same
+    flag_map repeatedly should build an extractor once instead.
+
     Args:
         value: Bitfield value
         flag_map: Mapping of bit positions to flag names
@@ -55,7 +61,28 @@ def extract_bitfield_flags(value: int, flag_map: Dict[int, str]) -> Dict[str, bo
     Returns:
         Dictionary of flag names to boolean values
     """
-    return {name: bool(value & (1 << bit)) for bit, name in flag_map.items()}
+    return make_bitfield_extractor(flag_map)(value)
+
+
+def make_bitfield_extractor(
+    flag_map: Dict[int, str],
+) -> Callable[[int], Dict[str, bool]]:
+    """Create a flag extractor with the bit masks computed once.
+
+    Each call of the returned function builds a new dictionary.
+
+    Args:
+        flag_map: Mapping of bit positions to flag names
+
+    Returns:
+        Function mapping a bitfield value to a dictionary of flag values
+    """
+    masks = tuple((name, 1 << bit) for bit, name in flag_map.items())
+
+    def extract(value: int) -> Dict[str, bool]:
+        return {name: bool(value & mask) for name, mask in masks}
+
+    return extract
 
 
 def parse_tagged_data(
@@ -63,6 +90,9 @@ def parse_tagged_data(
 ) -> Dict[str, Any]:
     """Parse tag-based data structure.
 
+    Thin wrapper over parse_tagged_values that keys values by field name
+    and omits fields whose tag is absent.
+
     Args:
         data: Data bytes containing tagged fields
         tag_map: Mapping of tag values to (field_name, byte_count) tuples
@@ -70,31 +100,72 @@ def parse_tagged_data(
     Returns:
         Dictionary of parsed field values
     """
+    tag_index = {
+        tag: (position, byte_count)
+        for position, (tag, (_, byte_count)) in enumerate(tag_map.items())
+    }
+    values = parse_tagged_values(data, tag_index, [_ABSENT] * len(tag_index))
+
     result = {}
-    offset = 0
+    for (field_name, _), value in zip(tag_map.values(), values):
+        if value is _ABSENT:
+            continue
+        # Wide fields come back as views into data; copy them out
+        result[field_name] = bytes(value) if isinstance(value, memoryview) else value
+    return result
 
-    while offset < len(data):
-        if offset >= len(data):
-            break
 
-        tag = data[offset]
+def parse_tagged_values(
+    data: bytes | memoryview,
+    tag_index: Dict[int, Tuple[int, int]],
+    defaults: Sequence[Any],
+) -> List[Any]:
+    """Parse tag-based data into a list of values in a fixed field order.
+
+    Each tag is followed by a 1-byte, big-endian 2-byte, or wider value.
+    Values are stored at a position known in advance so callers can unpack
+    the result directly. Unknown tags are skipped along with one value
+    byte; a truncated value stops parsing.
+
+    Fields wider than two bytes are returned as memoryview slices that
+    share memory with data rather than copies. They are only valid while
+    data is unchanged, so callers that keep one must convert it with
+    bytes().
+
+    Args:
+        data: Data bytes containing tagged fields
+        tag_index: Mapping of tag values to (position, byte_count) tuples
+        defaults: Values for fields whose tag is absent, in field order
+
+    Returns:
+        List of field values in the order of defaults
+    """
+    view = memoryview(data)
+    result = list(defaults)
+    offset = 0
+    data_len = len(view)
+
+    while offset < data_len:
+        tag = view[offset]
         offset += 1
 
-        if tag in tag_map:
-            field_name, byte_count = tag_map[tag]
-            if offset + byte_count <= len(data):
-                if byte_count == 1:
-                    result[field_name] = data[offset]
-                elif byte_count == 2:
-                    result[field_name] = parse_big_endian_uint16(data, offset)
-                else:
-                    result[field_name] = data[offset : offset + byte_count]
-                offset += byte_count
-            else:
-                logger.warning("Insufficient data for tag 0x%02x", tag)
-                break
-        else:
+        entry = tag_index.get(tag)
+        if entry is None:
             logger.warning("Unknown tag 0x%02x at offset %d", tag, offset - 1)
             offset += 1
+            continue
+
+        position, byte_count = entry
+        end = offset + byte_count
+        if end > data_len:
+            logger.warning("Insufficient data for tag 0x%02x", tag)
+            break
+        if byte_count == 1:
+            result[position] = view[offset]
+        elif byte_count == 2:
+            result[position] = (view[offset] << 8) | view[offset + 1]
+        else:
+            result[position] = view[offset:end]
+        offset = end
 
     return result
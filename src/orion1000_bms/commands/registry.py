@@ -1,7 +1,8 @@
 """Command registry and command ID definitions."""
 
 from enum import IntEnum
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Mapping, cast
 from .base import CommandSpec
 from ..protocol.constants import (
     CMD_VOLTAGE_REQUEST,
@@ -28,4 +29,37 @@ class CommandId(IntEnum):
     DISALLOW_CHARGE = CMD_DISALLOW_CHARGE
 
 
-COMMANDS: Dict[CommandId, CommandSpec] = {}
+_REGISTRY: Dict[CommandId, CommandSpec] = {}
+
+# Read-only live view of the registry; add entries with register_command()
+COMMANDS: Mapping[CommandId, CommandSpec] = MappingProxyType(_REGISTRY)
+
+# CommandId is an IntEnum, so raw command ints hash to the same keys
+_LOOKUP = cast(Dict[int, CommandSpec], _REGISTRY)
+
+
+def lookup_command(command_id: int) -> CommandSpec | None:
+    """Look up the spec for a raw command id without going through COMMANDS.
+
+    Args:
+        command_id: Command identifier, as a CommandId or plain int
+
+    Returns:
+        Registered specification, or None if the command is unknown
+    """
+    return _LOOKUP.get(command_id)
+
+
+def register_command(command_id: CommandId, spec: CommandSpec) -> None:
+    """Register the request/response types for a command.
+
+    Args:
+        command_id: Command identifier to register
+        spec: Request/response specification for the command
+
+    Raises:
+        ValueError: If the command is already registered
+    """
+    if command_id in _REGISTRY:
+        raise ValueError(f"Command {command_id!r} is already registered")
+    _REGISTRY[command_id] = spec
@@ -3,23 +3,19 @@
 from __future__ import annotations
 import logging
 from dataclasses import dataclass
-from .registry import CommandId, COMMANDS
-from .base import CommandSpec, ResponseBase
+from .registry import CommandId, register_command
+from .base import CommandSpec, EmptyPayloadMixin, ResponseBase
 
 logger = logging.getLogger(__name__)
 
 
 @dataclass(slots=True)
-class SerialNumberRequest:
+class SerialNumberRequest(EmptyPayloadMixin):
     """Request to read device serial number."""
 
     command_id: int = CommandId.SERIAL_NUMBER_REQUEST
     address: int = 0x01
 
-    def to_payload(self) -> bytes:
-        """Convert to payload bytes (empty for serial number request)."""
-        return b""
-
 
 @dataclass(slots=True, frozen=True)
 class SerialNumberResponse(ResponseBase):
@@ -28,7 +24,7 @@ class SerialNumberResponse(ResponseBase):
     serial_number: str  # ASCII serial number string
 
     @classmethod
-    def from_payload(cls, payload: bytes) -> SerialNumberResponse:
+    def from_payload(cls, payload: bytes | memoryview) -> SerialNumberResponse:
         """Parse serial number from payload bytes.
 
         Args:
@@ -40,8 +36,8 @@ class SerialNumberResponse(ResponseBase):
         if len(payload) < 3:
             raise ValueError(f"Payload too short for serial number: {len(payload)}")
 
-        # Skip command bytes (first 2 bytes)
-        data = payload[2:]
+        # Skip command bytes (first 2 bytes) without copying the rest
+        data = memoryview(payload)[2:]
 
         # First byte is length of ASCII string
         length = data[0]
@@ -55,14 +51,16 @@ class SerialNumberResponse(ResponseBase):
 
         # Extract ASCII string
         serial_bytes = data[1 : 1 + length]
-        serial_number = serial_bytes.decode("ascii", errors="replace")
+        serial_number = str(serial_bytes, "ascii", "replace")
 
-        logger.debug("Parsed serial number: %s", serial_number)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Parsed serial number: %s", serial_number)
 
         return cls(serial_number=serial_number)
 
 
 # Register command
-COMMANDS[CommandId.SERIAL_NUMBER_REQUEST] = CommandSpec(
-    req=SerialNumberRequest, resp=SerialNumberResponse
+register_command(
+    CommandId.SERIAL_NUMBER_REQUEST,
+    CommandSpec(req=SerialNumberRequest, resp=SerialNumberResponse),
 )
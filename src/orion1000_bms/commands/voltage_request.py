@@ -2,26 +2,29 @@
 
 from __future__ import annotations
 import logging
+import struct
 from dataclasses import dataclass
+from functools import cache
 from typing import List
-from .registry import CommandId, COMMANDS
-from .base import CommandSpec, ResponseBase
-from .parsing_utils import parse_big_endian_uint16
+from .registry import CommandId, register_command
+from .base import CommandSpec, EmptyPayloadMixin, ResponseBase
 
 logger = logging.getLogger(__name__)
 
 
+@cache
+def _cell_voltages_struct(cell_count: int) -> struct.Struct:
+    """Return a big-endian layout for cell_count 16-bit cell voltages."""
+    return struct.Struct(f">{cell_count}H")
+
+
 @dataclass(slots=True)
-class VoltageRequest:
+class VoltageRequest(EmptyPayloadMixin):
     """Request to read all cell voltages and temperatures."""
 
     command_id: int = CommandId.VOLTAGE_REQUEST
     address: int = 0x01
 
-    def to_payload(self) -> bytes:
-        """Convert to payload bytes (empty for voltage request)."""
-        return b""
-
 
 @dataclass(slots=True, frozen=True)
 class VoltageResponse(ResponseBase):
@@ -33,7 +36,7 @@ class VoltageResponse(ResponseBase):
     total_system_cells: int  # Total cells in the system
 
     @classmethod
-    def from_payload(cls, payload: bytes) -> VoltageResponse:
+    def from_payload(cls, payload: bytes | memoryview) -> VoltageResponse:
         """Parse voltage data from payload bytes.
 
         Args:
@@ -45,8 +48,8 @@ class VoltageResponse(ResponseBase):
         # Validate minimum payload length: cmd(2) + cell_count(1) + temp_probes(1) + total_cells(1) = 5 bytes
         cls.validate_minimum_payload_length(payload, 3)
 
-        # Skip command bytes (first 2 bytes)
-        data = payload[2:]
+        # Skip command bytes (first 2 bytes) without copying the rest
+        data = memoryview(payload)[2:]
 
         # Parse metadata fields according to new spec
         cell_count_in_packet = data[0]  # Byte 7 in spec
@@ -64,19 +67,17 @@ class VoltageResponse(ResponseBase):
             )
 
         # Parse cell voltages (2 bytes each, in mV, big-endian)
-        cell_voltages = []
-        for i in range(cell_count_in_packet):
-            offset = 3 + (i * 2)  # Skip metadata bytes
-            voltage_raw = parse_big_endian_uint16(data, offset)
-            voltage = voltage_raw / 1000.0  # Convert mV to V
-            cell_voltages.append(voltage)
-
-        logger.debug(
-            "Parsed voltage response: %d cells in packet, %d temp probes, %d total system cells",
-            cell_count_in_packet,
-            temp_probe_count,
-            total_system_cells,
-        )
+        # in one unpack after the 3 metadata bytes; convert mV to V
+        layout = _cell_voltages_struct(cell_count_in_packet)
+        cell_voltages = [raw / 1000.0 for raw in layout.unpack_from(data, 3)]
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Parsed voltage response: %d cells in packet, %d temp probes, %d total system cells",
+                cell_count_in_packet,
+                temp_probe_count,
+                total_system_cells,
+            )
 
         return cls(
             cell_voltages=cell_voltages,
@@ -87,6 +88,7 @@ class VoltageResponse(ResponseBase):
 
 
 # Register command
-COMMANDS[CommandId.VOLTAGE_REQUEST] = CommandSpec(
-    req=VoltageRequest, resp=VoltageResponse
+register_command(
+    CommandId.VOLTAGE_REQUEST,
+    CommandSpec(req=VoltageRequest, resp=VoltageResponse),
 )
@@ -16,6 +16,11 @@ class TimeoutError(TransportError):
     pass
 
 
+class CircuitOpenError(TransportError):
+    """Request rejected because the circuit breaker is open."""
+    pass
+
+
 class ChecksumError(BmsError):
     """Frame checksum validation error."""
     pass
@@ -36,10 +36,27 @@ def hex_dump(data: bytes, prefix: str = "") -> str:
     if not data:
         return f"{prefix}<empty>"
 
-    hex_str = data.hex().upper()
-    # Add spaces between bytes
-    formatted = " ".join(hex_str[i : i + 2] for i in range(0, len(hex_str), 2))
-    return f"{prefix}{formatted}"
+    # Space-separated byte pairs in a single C call
+    return f"{prefix}{data.hex(' ').upper()}"
+
+
+class _LazyHex:
+    """Defer hex_dump until a log record is actually formatted.
+
+    Callers still gate on isEnabledFor(DEBUG); passed as a %-style logging
+    argument, ``__str__`` additionally only runs when a handler formats
+    the record, so records dropped by handler levels or filters never
+    build the hex string.
+    """
+
+    __slots__ = ("data", "prefix")
+
+    def __init__(self, data: bytes, prefix: str = "") -> None:
+        self.data = data
+        self.prefix = prefix
+
+    def __str__(self) -> str:
+        return hex_dump(self.data, self.prefix)
 
 
 def log_frame_tx(logger: logging.Logger, frame: bytes, description: str = "TX") -> None:
@@ -51,7 +68,7 @@ def log_frame_tx(logger: logging.Logger, frame: bytes, description: str = "TX")
         description: Frame description
     """
     if logger.isEnabledFor(logging.DEBUG):
-        logger.debug("%s: %s", description, hex_dump(frame))
+        logger.debug("%s: %s", description, _LazyHex(frame))
 
 
 def log_frame_rx(logger: logging.Logger, frame: bytes, description: str = "RX") -> None:
@@ -63,4 +80,4 @@ def log_frame_rx(logger: logging.Logger, frame: bytes, description: str = "RX")
         description: Frame description
     """
     if logger.isEnabledFor(logging.DEBUG):
-        logger.debug("%s: %s (%s bytes)", description, hex_dump(frame), len(frame))
+        logger.debug("%s: %s (%s bytes)", description, _LazyHex(frame), len(frame))
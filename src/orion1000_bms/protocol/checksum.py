@@ -0,0 +1,45 @@
+"""XOR checksum used by BMS protocol frames."""
+
+# Below this size a plain per-byte loop beats the word-folding path on CPython
+_SWAR_MIN_LEN = 64
+
+
+def xor_checksum(
+    data: bytes | bytearray | memoryview, start: int = 0, stop: int | None = None
+) -> int:
+    """Calculate XOR checksum of data bytes.
+
+    Large inputs are packed into a single integer and folded in half until one
+    64-bit word remains, which is then folded down to a byte (SWAR reduction).
+    This replaces one interpreter iteration per byte with O(log n) big-int ops.
+
+    Args:
+        data: Bytes or any byte buffer to checksum (Length through Data,
+            excluding Product ID and Address)
+        start: Index of the first byte to include
+        stop: Index one past the last byte to include (default: end of data)
+
+    Returns:
+        XOR checksum as integer
+    """
+    view: bytes | bytearray | memoryview = data
+    if start or stop is not None:
+        # Checksum a window of a larger frame without copying it out
+        view = memoryview(data)[start:stop]
+    size = len(view)
+    if size < _SWAR_MIN_LEN:
+        checksum = 0
+        for byte in view:
+            checksum ^= byte
+        return checksum
+
+    acc = int.from_bytes(view, "little")
+    while size > 8:
+        half = (size + 1) >> 1
+        shift = half << 3
+        acc = (acc >> shift) ^ (acc & ((1 << shift) - 1))
+        size = half
+    acc ^= acc >> 32
+    acc ^= acc >> 16
+    acc ^= acc >> 8
+    return acc & 0xFF
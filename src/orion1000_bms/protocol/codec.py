@@ -2,28 +2,13 @@
 
 from dataclasses import asdict
 import logging
+from .checksum import xor_checksum
 from .constants import START, END, PRODUCT_ID_DEFAULT
-from typing import TYPE_CHECKING
+from .frame import _HEADER, Frame
 
 logger = logging.getLogger(__name__)
 
-if TYPE_CHECKING:
-    from .frame import Frame
-
-
-def xor_checksum(data: bytes) -> int:
-    """Calculate XOR checksum of data bytes.
-
-    Args:
-        data: Bytes to checksum (Length through Data, excluding Product ID and Address)
-
-    Returns:
-        XOR checksum as integer
-    """
-    checksum = 0
-    for byte in data:
-        checksum ^= byte
-    return checksum
+__all__ = ["build_frame", "decode", "xor_checksum"]
 
 
 def build_frame(
@@ -45,19 +30,21 @@ def build_frame(
     data_len = 2 + len(payload) + 2  # cmd_hi + cmd_lo + payload + checksum + end
 
     # Build frame without checksum
-    frame_data = bytes([START, product_id, address, data_len, cmd_hi, cmd_lo]) + payload
+    frame_data = (
+        _HEADER.pack(START, product_id, address, data_len, cmd_hi, cmd_lo) + payload
+    )
 
     # Calculate checksum from Length through payload (excluding Product ID and Address)
-    checksum_data = frame_data[3:]  # Skip start, product_id, address
-    checksum = xor_checksum(checksum_data)
+    checksum = xor_checksum(frame_data[3:])
 
     # Add checksum and end
-    frame = frame_data + bytes([checksum, END])
-    logger.debug("Built frame: cmd=0x%02x%02x, len=%d", cmd_hi, cmd_lo, len(frame))
+    frame = frame_data + bytes((checksum, END))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Built frame: cmd=0x%02x%02x, len=%d", cmd_hi, cmd_lo, len(frame))
     return frame
 
 
-def decode(raw: bytes) -> "Frame":
+def decode(raw: bytes) -> Frame:
     """Decode raw bytes to Frame.
 
     Args:
@@ -66,18 +53,17 @@ def decode(raw: bytes) -> "Frame":
     Returns:
         Parsed Frame object
     """
-    from .frame import Frame
-
     try:
         frame = Frame.from_bytes(raw)
-        logger.debug(
-            "Decoded frame: cmd=0x%02x%02x, len=%d",
-            frame.cmd_hi,
-            frame.cmd_lo,
-            len(raw),
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Decoded frame: cmd=0x%02x%02x, len=%d",
+                frame.cmd_hi,
+                frame.cmd_lo,
+                len(raw),
+            )
 
         return frame
-    except Exception as e:
+    except Exception:
         logger.exception("Failed to decode frame of length %d", len(raw))
         raise
@@ -2,17 +2,37 @@
 
 from __future__ import annotations
 import logging
+import struct
 from dataclasses import dataclass
+from typing import NoReturn
 from .constants import START, END, PRODUCT_ID_DEFAULT
-from .codec import xor_checksum
+from .checksum import xor_checksum
 from ..exceptions import FrameError, ChecksumError
 
 logger = logging.getLogger(__name__)
 
+# START, product ID, address, length, command high, command low
+_HEADER = struct.Struct("6B")
+
+
+class _SerializedCache:
+    """Declares the slot Frame caches its serialized bytes in.
+
+    Kept outside the dataclass fields so the cache never shows up in
+    fields(), asdict(), replace() or comparisons.
+    """
+
+    __slots__ = ("_cached_bytes",)
+
 
 @dataclass(slots=True, frozen=True)
-class Frame:
-    """BMS protocol frame structure."""
+class Frame(_SerializedCache):
+    """BMS protocol frame structure.
+
+    Pass ``checksum=None`` when building a frame from scratch to have
+    to_bytes() compute it. A given checksum is emitted as-is; from_bytes()
+    only ever stores one it has validated.
+    """
 
     start: int
     product_id: int
@@ -21,96 +41,79 @@ class Frame:
     cmd_hi: int
     cmd_lo: int
     payload: bytes
-    checksum: int
+    checksum: int | None
     end: int
 
     def to_bytes(self) -> bytes:
         """Convert frame to bytes."""
+        # Filled on the first call; fields are frozen, so it never goes stale
+        cached: bytes | None = getattr(self, "_cached_bytes", None)
+        if cached is not None:
+            return cached
+
         # Build frame without checksum first
         frame_data = (
-            bytes(
-                [
-                    self.start,
-                    self.product_id,
-                    self.address,
-                    self.data_len,
-                    self.cmd_hi,
-                    self.cmd_lo,
-                ]
+            _HEADER.pack(
+                self.start,
+                self.product_id,
+                self.address,
+                self.data_len,
+                self.cmd_hi,
+                self.cmd_lo,
             )
             + self.payload
         )
 
-        # Calculate checksum from Length through payload (excluding Product ID and Address)
-        checksum_data = frame_data[3:]  # Skip start, product_id, address
-        calculated_checksum = xor_checksum(checksum_data)
+        # Calculate checksum from Length through payload (excluding Product ID
+        # and Address) unless one was supplied
+        checksum = self.checksum
+        if checksum is None:
+            checksum = xor_checksum(frame_data[3:])
 
         # Add checksum and end byte
-        return frame_data + bytes([calculated_checksum, self.end])
+        raw = frame_data + bytes((checksum, self.end))
+        object.__setattr__(self, "_cached_bytes", raw)
+        return raw
 
     @classmethod
     def from_bytes(cls, raw: bytes) -> Frame:
-        """Parse frame from bytes with validation."""
-        if len(raw) < 8:
-            logger.warning("Frame too short: %d bytes", len(raw))
-            raise FrameError("Frame too short")
-
-        start = raw[0]
-        if start != START:
-            logger.warning("Invalid start byte: 0x%02x", start)
-            raise FrameError(f"Invalid start byte: {start:#x}")
-
-        product_id = raw[1]
-        address = raw[2]
-        data_len = raw[3]
-
-        # Validate frame length - data_len includes everything after length byte through end byte
-        expected_len = 4 + data_len  # header(4) + data_len bytes
-        if len(raw) != expected_len:
-            logger.warning("Invalid frame length: %d != %d", len(raw), expected_len)
-            raise FrameError(f"Invalid frame length: {len(raw)} != {expected_len}")
-
-        # Validate minimum data_len (cmd_hi + cmd_lo + checksum + end = 4 bytes minimum)
-        if data_len < 4:
-            logger.warning("Data length too short: %d", data_len)
-            raise FrameError(f"Data length too short: {data_len}")
-
-        cmd_hi = raw[4]
-        cmd_lo = raw[5]
-
-        # Payload is everything between command bytes and checksum
-        payload_end_idx = 4 + data_len - 2  # Exclude checksum and end byte
-        payload = raw[6:payload_end_idx]
+        """Parse frame from bytes with validation.
+
+        Valid frames are accepted with one combined check; anything else is
+        handed to _diagnose, which raises the specific error.
+        """
+        raw_len = len(raw)
+        if raw_len < 8:
+            _diagnose(raw)
+
+        start, product_id, address, data_len, cmd_hi, cmd_lo = _HEADER.unpack_from(raw)
+        # data_len covers everything after the length byte through the end byte
+        payload_end_idx = data_len + 2
+        if not (
+            start == START
+            and raw_len == data_len + 4
+            and data_len >= 4
+            and raw[-1] == END
+            and raw[-2] == xor_checksum(raw, 3, payload_end_idx)
+        ):
+            _diagnose(raw)
 
-        checksum = raw[payload_end_idx]  # checksum is 2nd to last byte
-        end = raw[payload_end_idx + 1]  # end is last byte
+        payload = raw[6:payload_end_idx]
+        checksum = raw[-2]
+        end = raw[-1]
 
-        if end != END:
-            logger.warning("Invalid end byte: 0x%02x", end)
-            raise FrameError(f"Invalid end byte: {end:#x}")
-        else:
+        # Every received frame passes through here; skip building log
+        # arguments unless debug output is actually wanted
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("Last byte validation: PASS")
-
-        # Verify checksum - includes length through payload (excluding checksum and end)
-        checksum_data = raw[3:payload_end_idx]
-        expected_checksum = xor_checksum(checksum_data)
-        if checksum != expected_checksum:
-            logger.warning(
-                "Checksum mismatch: 0x%02x != 0x%02x", checksum, expected_checksum
-            )
-            raise ChecksumError(
-                f"Checksum mismatch: {checksum:#x} != {expected_checksum:#x}"
-            )
-        else:
             logger.debug("Checksum validation: PASS")
-
-        logger.debug(
-            "Parsed frame: cmd=0x%02x%02x, addr=0x%02x, payload_len=%d",
-            cmd_hi,
-            cmd_lo,
-            address,
-            len(payload),
-        )
+            logger.debug(
+                "Parsed frame: cmd=0x%02x%02x, addr=0x%02x, payload_len=%d",
+                cmd_hi,
+                cmd_lo,
+                address,
+                len(payload),
+            )
         return cls(
             start=start,
             product_id=product_id,
@@ -122,3 +125,48 @@ class Frame:
             checksum=checksum,
             end=end,
         )
+
+
+def _diagnose(raw: bytes) -> NoReturn:
+    """Raise the specific error for a frame that failed validation.
+
+    Args:
+        raw: Frame bytes rejected by Frame.from_bytes
+
+    Raises:
+        FrameError: If the length, start byte, or end byte is invalid
+        ChecksumError: If the checksum does not match
+    """
+    if len(raw) < 8:
+        logger.warning("Frame too short: %d bytes", len(raw))
+        raise FrameError("Frame too short")
+
+    start, _, _, data_len, _, _ = _HEADER.unpack_from(raw)
+    if start != START:
+        logger.warning("Invalid start byte: 0x%02x", start)
+        raise FrameError(f"Invalid start byte: {start:#x}")
+
+    # Validate frame length - data_len includes everything after length byte through end byte
+    expected_len = 4 + data_len  # header(4) + data_len bytes
+    if len(raw) != expected_len:
+        logger.warning("Invalid frame length: %d != %d", len(raw), expected_len)
+        raise FrameError(f"Invalid frame length: {len(raw)} != {expected_len}")
+
+    # Validate minimum data_len (cmd_hi + cmd_lo + checksum + end = 4 bytes minimum)
+    if data_len < 4:
+        logger.warning("Data length too short: %d", data_len)
+        raise FrameError(f"Data length too short: {data_len}")
+
+    # Checksum is 2nd to last byte, end is last byte
+    payload_end_idx = 4 + data_len - 2
+    checksum = raw[payload_end_idx]
+    end = raw[payload_end_idx + 1]
+
+    if end != END:
+        logger.warning("Invalid end byte: 0x%02x", end)
+        raise FrameError(f"Invalid end byte: {end:#x}")
+
+    # Verify checksum - includes length through payload (excluding checksum and end)
+    expected_checksum = xor_checksum(raw, 3, payload_end_idx)
+    logger.warning("Checksum mismatch: 0x%02x != 0x%02x", checksum, expected_checksum)
+    raise ChecksumError(f"Checksum mismatch: {checksum:#x} != {expected_checksum:#x}")
@@ -1,10 +1,18 @@
 """Abstract transport interface."""
 
+import random
 import time
 from abc import ABC, abstractmethod
 from typing import Protocol
-from ..exceptions import TimeoutError
+from ..exceptions import TimeoutError, TransportError
 from ..logging import get_logger
+from .circuit_breaker import CircuitBreaker
+
+# Retry backoff defaults shared by every transport: first retry delay in
+# seconds (doubled per retry), cap on any single delay, and random jitter
+DEFAULT_BASE_DELAY = 0.1
+DEFAULT_MAX_DELAY = 2.0
+DEFAULT_JITTER = 0.1
 
 
 class AbstractTransport(Protocol):
@@ -37,15 +45,47 @@ class AbstractTransport(Protocol):
 class BaseTransport(ABC):
     """Base transport with retry logic."""
 
-    def __init__(self, *, max_retries: int = 3) -> None:
+    def __init__(
+        self,
+        *,
+        max_retries: int = 3,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        jitter: float = DEFAULT_JITTER,
+        circuit_breaker: CircuitBreaker | None = None,
+    ) -> None:
         """Initialize base transport.
 
         Args:
             max_retries: Maximum number of retries on timeout (default: 3)
+            base_delay: Delay before the first retry, doubled on each retry
+            max_delay: Upper bound on any single retry delay
+            jitter: Random extra delay of up to this many seconds per retry
+            circuit_breaker: Optional breaker to fail fast while the device
+                is unreachable
         """
         self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.circuit_breaker = circuit_breaker
         self._logger = get_logger(__name__)
 
+    def _backoff_delay(self, attempt: int) -> float:
+        """Return the sleep before retrying after the given zero-based attempt.
+
+        Exponential growth spaces out retries against a device that is down;
+        the jitter keeps several clients from reconnecting in lockstep.
+
+        Args:
+            attempt: Index of the attempt that just failed
+
+        Returns:
+            Delay in seconds, never more than max_delay
+        """
+        delay = self.base_delay * (1 << attempt) + random.uniform(0, self.jitter)
+        return min(delay, self.max_delay)
+
     @abstractmethod
     def _send_request_impl(
         self, payload: bytes, *, timeout: float | None = None
@@ -70,7 +110,31 @@ class BaseTransport(ABC):
 
         Returns:
             Response frame bytes
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is rejecting requests
         """
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return self._send_with_retries(payload, timeout=timeout)
+
+        breaker.before_request()
+        try:
+            response = self._send_with_retries(payload, timeout=timeout)
+        except TransportError:
+            breaker.record_failure()
+            raise
+        except BaseException:
+            # Not a transport failure, so no outcome to record for a probe
+            breaker.release_probe()
+            raise
+        breaker.record_success()
+        return response
+
+    def _send_with_retries(
+        self, payload: bytes, *, timeout: float | None = None
+    ) -> bytes:
+        """Send request, retrying timeouts with backoff."""
         last_error: TimeoutError | None = None
 
         for attempt in range(self.max_retries + 1):
@@ -84,7 +148,7 @@ class BaseTransport(ABC):
                         attempt + 1,
                         self.max_retries,
                     )
-                    time.sleep(0.1)  # Brief delay before retry
+                    time.sleep(self._backoff_delay(attempt))
                 else:
                     self._logger.debug(
                         "Request failed after %d retries", self.max_retries
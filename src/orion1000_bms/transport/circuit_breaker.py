@@ -0,0 +1,105 @@
+"""Circuit breaker for failing fast while the BMS is unreachable."""
+
+import threading
+import time
+from enum import Enum
+
+from ..exceptions import CircuitOpenError
+from ..logging import get_logger
+
+
+class CircuitState(Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker around transport requests.
+
+    After ``failure_threshold`` consecutive failed requests the circuit opens
+    and requests are rejected immediately with CircuitOpenError instead of
+    paying connect and read timeouts. Once ``reset_timeout`` has elapsed a
+    single probe request is let through; its outcome closes the circuit or
+    opens it for another ``reset_timeout``. Other requests arriving while the
+    probe is in flight are rejected like those on an open circuit. The
+    breaker is safe to share between threads.
+    """
+
+    def __init__(
+        self, *, failure_threshold: int = 5, reset_timeout: float = 30.0
+    ) -> None:
+        """Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds to stay open before allowing a probe
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failure_count = 0
+        self.state = CircuitState.CLOSED
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+        # A transport may be shared by several clients, each with its own
+        # lock, so state transitions are serialized here
+        self._lock = threading.Lock()
+        self._logger = get_logger(__name__)
+
+    def before_request(self) -> None:
+        """Check whether a request may proceed.
+
+        Raises:
+            CircuitOpenError: If the circuit is open and not yet due a probe,
+                or a probe is already in flight
+        """
+        with self._lock:
+            if self.state is CircuitState.CLOSED:
+                return
+
+            if self._probe_in_flight:
+                raise CircuitOpenError("Circuit half-open, probe request in flight")
+
+            remaining = self.reset_timeout - (time.monotonic() - self.opened_at)
+            if remaining > 0:
+                raise CircuitOpenError(
+                    f"Circuit open after {self.failure_count} failures, "
+                    f"retry in {remaining:.1f}s"
+                )
+
+            self._logger.debug("Circuit half-open, allowing probe request")
+            self.state = CircuitState.HALF_OPEN
+            self._probe_in_flight = True
+
+    def release_probe(self) -> None:
+        """Let another probe through after one ended without an outcome."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        with self._lock:
+            if self.state is not CircuitState.CLOSED:
+                self._logger.debug("Circuit closed after successful request")
+            self.failure_count = 0
+            self.state = CircuitState.CLOSED
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the circuit at the threshold."""
+        with self._lock:
+            self.failure_count += 1
+            if (
+                self.state is CircuitState.HALF_OPEN
+                or self.failure_count >= self.failure_threshold
+            ):
+                if self.state is not CircuitState.OPEN:
+                    self._logger.warning(
+                        "Circuit opened after %d consecutive failures",
+                        self.failure_count,
+                    )
+                self.state = CircuitState.OPEN
+                self.opened_at = time.monotonic()
+            self._probe_in_flight = False
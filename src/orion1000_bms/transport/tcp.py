@@ -2,12 +2,27 @@
 
 import time
 import logging
+import select
+import socket
 from typing import Optional
 import serial
 from ..protocol.constants import START, END
 from ..exceptions import TransportError, TimeoutError
 from ..logging import get_logger, log_frame_tx, log_frame_rx
-from .base import BaseTransport
+from .base import (
+    DEFAULT_BASE_DELAY,
+    DEFAULT_JITTER,
+    DEFAULT_MAX_DELAY,
+    BaseTransport,
+)
+from .circuit_breaker import CircuitBreaker
+
+
+# Attempts per request when the connection drops, each on a fresh socket
+_CONNECTION_ATTEMPTS = 2
+
+# TCP keepalive timing: idle seconds, probe interval, probe count
+_KEEPALIVE_TUNING = (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 5), ("TCP_KEEPCNT", 3))
 
 
 class TcpTransport(BaseTransport):
@@ -21,9 +36,16 @@ class TcpTransport(BaseTransport):
         connect_timeout: float = 5.0,
         read_timeout: float = 3.0,
         max_retries: int = 3,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        jitter: float = DEFAULT_JITTER,
+        circuit_failure_threshold: int | None = None,
+        circuit_reset_timeout: float = 30.0,
         connection_strategy: str = "persistent",
-        force_reconnect_interval: float = 300.0,
+        force_reconnect_interval: float | None = None,
         buffer_settling_time: float = 0.1,
+        low_latency: bool = True,
+        keepalive: bool = True,
     ) -> None:
         """Initialize TCP transport.
 
@@ -33,19 +55,48 @@ class TcpTransport(BaseTransport):
             connect_timeout: Connection timeout (unused with pyserial)
             read_timeout: Read timeout in seconds
             max_retries: Maximum number of retries on timeout
+            base_delay: Delay before the first retry, doubled on each retry
+            max_delay: Upper bound on any single retry delay
+            jitter: Random extra delay of up to this many seconds per retry
+            circuit_failure_threshold: Consecutive failed requests before
+                failing fast with CircuitOpenError; None (the default)
+                disables the circuit breaker
+            circuit_reset_timeout: Seconds to fail fast before probing again
             connection_strategy: "persistent" or "per_request"
-            force_reconnect_interval: Force reconnect after this many seconds
+            force_reconnect_interval: Force reconnect after this many seconds;
+                None (the default) keeps a healthy connection indefinitely
             buffer_settling_time: Delay after connection establishment
+            low_latency: Disable Nagle's algorithm on the socket so small
+                request frames are sent immediately
+            keepalive: Enable TCP keepalive probes so a dead peer or a
+                dropped NAT mapping is noticed on an idle connection
         """
-        super().__init__(max_retries=max_retries)
+        super().__init__(
+            max_retries=max_retries,
+            base_delay=base_delay,
+            max_delay=max_delay,
+            jitter=jitter,
+            circuit_breaker=(
+                CircuitBreaker(
+                    failure_threshold=circuit_failure_threshold,
+                    reset_timeout=circuit_reset_timeout,
+                )
+                if circuit_failure_threshold is not None
+                else None
+            ),
+        )
         self.host = host
         self.port = port
         self.read_timeout = read_timeout
         self.connection_strategy = connection_strategy
         self.force_reconnect_interval = force_reconnect_interval
         self.buffer_settling_time = buffer_settling_time
+        self.low_latency = low_latency
+        self.keepalive = keepalive
         self._serial: Optional[serial.Serial] = None
         self._connection_time: float = 0.0
+        # Receive buffer sized for the largest frame the 1-byte length allows
+        self._rx_view = memoryview(bytearray(4 + 0xFF))
         self._logger = get_logger(__name__)
 
     def _is_connection_alive(self) -> bool:
@@ -58,15 +109,41 @@ class TcpTransport(BaseTransport):
             if not self._serial.is_open:
                 return False
             
-            # Check connection age
-            if (time.monotonic() - self._connection_time) > self.force_reconnect_interval:
+            # Check connection age, if a maximum age is configured
+            if (
+                self.force_reconnect_interval is not None
+                and (time.monotonic() - self._connection_time)
+                > self.force_reconnect_interval
+            ):
                 self._logger.debug("Connection aged out, forcing reconnect")
                 return False
-            
+
+            if self._peer_closed():
+                self._logger.debug("Peer closed connection, forcing reconnect")
+                return False
+
             return True
         except Exception:
             return False
     
+    def _peer_closed(self) -> bool:
+        """Probe the socket for an orderly shutdown from the remote end.
+
+        A readable socket with nothing to peek at means the peer sent FIN,
+        so the persistent connection can be replaced before a request is
+        written into it rather than after a failed read.
+        """
+        sock = getattr(self._serial, "_socket", None)
+        if not isinstance(sock, socket.socket):
+            return False
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+            if not readable:
+                return False
+            return sock.recv(1, socket.MSG_PEEK) == b""
+        except (OSError, ValueError):
+            return True
+
     def _force_close(self) -> None:
         """Force close connection."""
         if self._serial:
@@ -77,6 +154,36 @@ class TcpTransport(BaseTransport):
             self._serial = None
             self._connection_time = 0.0
     
+    def _tune_socket(self) -> None:
+        """Apply latency and keepalive options to the underlying socket.
+
+        Requests are a handful of bytes followed by a wait for the reply, the
+        worst case for Nagle's algorithm combined with delayed ACKs. Keepalive
+        probes let an idle persistent connection detect a dead peer without
+        tearing down healthy sockets on a timer.
+        """
+        sock = getattr(self._serial, "_socket", None)
+        if sock is None:
+            return
+
+        options: list[tuple[int, int, int]] = []
+        if self.low_latency:
+            options.append((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1))
+        if self.keepalive:
+            options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+            # Probe after 30s idle, every 5s, giving up after 3 misses;
+            # not every platform exposes these knobs
+            for name, value in _KEEPALIVE_TUNING:
+                opt = getattr(socket, name, None)
+                if opt is not None:
+                    options.append((socket.IPPROTO_TCP, opt, value))
+
+        for level, opt, value in options:
+            try:
+                sock.setsockopt(level, opt, value)
+            except OSError as e:
+                self._logger.debug("Could not set socket option %d: %s", opt, e)
+
     def open_if_needed(self) -> None:
         """Open connection if not already open or validate existing connection."""
         # For per-request strategy, always use fresh connection
@@ -97,6 +204,7 @@ class TcpTransport(BaseTransport):
                 )
                 self._connection_time = time.monotonic()
                 self._logger.debug("Connected to %s:%d", self.host, self.port)
+                self._tune_socket()
                 
                 # Allow connection to settle
                 if self.buffer_settling_time > 0:
@@ -132,39 +240,37 @@ class TcpTransport(BaseTransport):
             Response frame bytes
         """
         last_error = None
-        
-        for attempt in range(2):  # Try twice with fresh connection on failure
+        attempts = _CONNECTION_ATTEMPTS
+
+        # Retry dropped connections on a fresh socket with backoff
+        for attempt in range(attempts):
             try:
                 self.open_if_needed()
 
                 if not self._serial:
                     raise TransportError("Serial connection not open")
 
-                # Enhanced buffer clearing
+                # Drop stale bytes from an earlier reply. On socket:// this
+                # drains everything readable in one pass, while the output
+                # reset and flush() are no-ops, so they are skipped
                 self._serial.reset_input_buffer()
-                self._serial.reset_output_buffer()
-                time.sleep(0.01)  # Brief settling time
-                self._serial.reset_input_buffer()  # Clear again
 
                 log_frame_tx(self._logger, payload)
                 self._serial.write(payload)
-                self._serial.flush()
 
                 # Read response
                 response = self._read_frame(timeout or self.read_timeout)
                 log_frame_rx(self._logger, response)
 
-                # Inter-request spacing per BMS protocol
-                time.sleep(0.25)  # Slightly longer spacing
-
+                # Inter-request spacing is enforced by BmsClient
                 return response
                 
             except (ConnectionResetError, BrokenPipeError, OSError) as e:
                 last_error = e
                 self._logger.warning("Connection error on attempt %d: %s", attempt + 1, e)
                 self._force_close()  # Force fresh connection on next attempt
-                if attempt == 0:
-                    time.sleep(0.5)  # Brief delay before retry
+                if attempt < attempts - 1:
+                    time.sleep(self._backoff_delay(attempt))
                 continue
                 
             except Exception as e:
@@ -178,57 +284,75 @@ class TcpTransport(BaseTransport):
                 self._force_close()
                 raise TransportError(f"Transport error: {e}")
         
-        # If we get here, both attempts failed
-        raise TransportError(f"Failed after 2 attempts, last error: {last_error}")
+        # If we get here, every attempt failed
+        raise TransportError(
+            f"Failed after {attempts} attempts, last error: {last_error}"
+        )
 
-    def _read_exact(self, n: int, *, timeout_s: float = 1.0) -> bytes:
-        """Read exactly n bytes or raise TimeoutError."""
+    def _read_into(self, view: memoryview, *, timeout_s: float) -> None:
+        """Fill view completely from the port or raise TimeoutError."""
         if not self._serial:
             raise TransportError("Serial connection not open")
 
-        end_by = time.monotonic() + timeout_s
-        buf = bytearray()
-        consecutive_empty_reads = 0
-        
-        while len(buf) < n:
-            if time.monotonic() > end_by:
-                raise TimeoutError(f"Timeout reading {n} bytes (got {len(buf)})")
-            
-            try:
-                chunk = self._serial.read(n - len(buf))
-                if chunk:
-                    buf.extend(chunk)
-                    consecutive_empty_reads = 0
-                else:
-                    consecutive_empty_reads += 1
-                    # If we get too many empty reads, the connection might be broken
-                    if consecutive_empty_reads > 50:  # Reduced threshold
-                        raise ConnectionResetError("Connection appears broken (too many empty reads)")
-                    time.sleep(0.01)  # Slightly longer sleep
-                    
-            except (ConnectionResetError, BrokenPipeError, OSError) as e:
-                raise ConnectionResetError(f"Connection error during read: {e}")
-            except Exception as e:
-                if "timeout" not in str(e).lower():
-                    raise TransportError(f"Read error: {e}")
-                raise TimeoutError(f"Timeout reading {n} bytes (got {len(buf)})")
-                
-        return bytes(buf)
+        # Bind hot lookups once for the read loop
+        port = self._serial
+        readinto = port.readinto
+        monotonic = time.monotonic
+
+        end_by = monotonic() + timeout_s
+        n = len(view)
+        got = 0
+        orig_timeout = port.timeout
+
+        try:
+            while got < n:
+                remaining = end_by - monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"Timeout reading {n} bytes (got {got})")
+
+                try:
+                    # Let the port block in select() until data arrives or the
+                    # deadline passes instead of polling with sleeps. pyserial's
+                    # readinto() is read() plus a copy, so each chunk is still
+                    # received as a bytes object before landing in view
+                    port.timeout = remaining
+                    count = readinto(view[got:])
+                except (ConnectionResetError, BrokenPipeError, OSError) as e:
+                    # pyserial reports a peer close as SerialException, an
+                    # OSError subclass
+                    raise ConnectionResetError(f"Connection error during read: {e}")
+                except Exception as e:
+                    if "timeout" not in str(e).lower():
+                        raise TransportError(f"Read error: {e}")
+                    raise TimeoutError(f"Timeout reading {n} bytes (got {got})")
+
+                if not count:
+                    # The port already waited out the rest of the deadline
+                    raise TimeoutError(f"Timeout reading {n} bytes (got {got})")
+                got += count
+        finally:
+            port.timeout = orig_timeout
 
     def _read_frame(self, timeout: float) -> bytes:
         """Read one complete frame with validation."""
+        # Header and body land in one reusable buffer rather than separate
+        # header, body and concatenated objects; pyserial still allocates a
+        # bytes object per chunk read, plus one for the returned frame
+        view = self._rx_view
+
         # Read header: [START PID addr len]
-        header = self._read_exact(4, timeout_s=timeout)
-        if header[0] != START:
-            raise TransportError(f"Bad start byte: {header[0]:#04x}")
+        self._read_into(view[:4], timeout_s=timeout)
+        if view[0] != START:
+            raise TransportError(f"Bad start byte: {view[0]:#04x}")
 
-        length = header[3]
+        length = view[3]
         if length < 4:
             raise TransportError(f"Length too small: {length}")
 
         # Read payload: data + checksum + end
-        payload = self._read_exact(length, timeout_s=timeout)
-        if payload[-1] != END:
+        frame_len = 4 + length
+        self._read_into(view[4:frame_len], timeout_s=timeout)
+        if view[frame_len - 1] != END:
             raise TransportError("Missing end byte")
 
-        return header + payload
+        return bytes(view[:frame_len])
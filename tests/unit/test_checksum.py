@@ -31,4 +31,35 @@ def test_xor_checksum_spec_example() -> None:
     # From updated spec: EA D1 01 02 FF 02 FF F5
     # Checksum covers: Length(0x02) + CmdHi(0xFF) + CmdLo(0x02) = 0xFF
     data = b"\x02\xFF\x02"
-    assert xor_checksum(data) == 0xFF
\ No newline at end of file
+    assert xor_checksum(data) == 0xFF
+
+
+@pytest.mark.phase1
+@pytest.mark.parametrize("size", [63, 64, 65, 100, 255, 256])
+def test_xor_checksum_long_data(size: int) -> None:
+    """Test word-folded checksum matches byte-wise XOR on long inputs."""
+    data = bytes((i * 37 + 11) & 0xFF for i in range(size))
+    expected = 0
+    for byte in data:
+        expected ^= byte
+    assert xor_checksum(data) == expected
+
+
+@pytest.mark.phase1
+def test_xor_checksum_window() -> None:
+    """Test checksum over a start/stop window matches checksum of the slice."""
+    raw = b"\xea\xd1\x01\x06\xff\x02\x12\x34\xcb\xf5"
+    assert xor_checksum(raw, 3, 8) == xor_checksum(raw[3:8])
+    assert xor_checksum(raw, 3) == xor_checksum(raw[3:])
+    assert xor_checksum(raw, stop=2) == 0xEA ^ 0xD1
+
+
+@pytest.mark.phase1
+@pytest.mark.parametrize("size", [5, 100])
+def test_xor_checksum_buffer_types(size: int) -> None:
+    """Test bytearray and memoryview inputs match bytes on both code paths."""
+    data = bytes((i * 37 + 11) & 0xFF for i in range(size))
+    expected = xor_checksum(data)
+    assert xor_checksum(bytearray(data)) == expected
+    assert xor_checksum(memoryview(data)) == expected
+    assert xor_checksum(memoryview(b"\x00" + data)[1:]) == expected
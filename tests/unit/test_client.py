@@ -1,5 +1,6 @@
 """Unit tests for BMS client."""
 
+import contextlib
 import time
 import struct
 from unittest.mock import Mock, patch
@@ -11,6 +12,7 @@ from orion1000_bms.commands import (
     VoltageResponse,
     CurrentStatusRequest,
     CurrentStatusResponse,
+    MosControlResponse,
 )
 from orion1000_bms.exceptions import UnsupportedCommandError
 from orion1000_bms.protocol.codec import build_frame
@@ -39,6 +41,23 @@ def test_client_initialization(mock_transport: Mock) -> None:
     assert client._min_spacing_s == 0.5
 
 
+@pytest.mark.phase6
+def test_client_without_locking(mock_transport: Mock) -> None:
+    """Test single-threaded clients skip the request lock."""
+    payload = bytearray([4, 3, 4])
+    for i in range(4):
+        payload.extend(struct.pack(">H", 3000))
+    mock_transport.send_request.return_value = build_frame(
+        PRODUCT_ID_DEFAULT, 0x01, COMMAND_HIGH, 0x02, bytes(payload)
+    )
+
+    client = BmsClient(mock_transport, min_spacing_s=0.0, thread_safe=False)
+    assert isinstance(client._lock, contextlib.nullcontext)
+
+    resp = client.request(VoltageRequest())
+    assert isinstance(resp, VoltageResponse)
+
+
 @pytest.mark.phase6
 def test_request_basic(client: BmsClient, mock_transport: Mock) -> None:
     """Test basic request/response."""
@@ -95,6 +114,37 @@ def test_request_with_timeout(client: BmsClient, mock_transport: Mock) -> None:
     assert call_args[1]["timeout"] == 5.0
 
 
+@pytest.mark.phase6
+def test_request_uses_prebuilt_frame(mock_transport: Mock) -> None:
+    """Test payload-free requests send the frame prebuilt at init."""
+    client = BmsClient(mock_transport, product_id=0xAA, address=0x02, min_spacing_s=0.0)
+    mock_transport.send_request.return_value = build_frame(
+        0xAA, 0x02, COMMAND_HIGH, 0x03, bytes(15)
+    )
+
+    with patch("orion1000_bms.client.build_frame") as mock_build:
+        client.request(CurrentStatusRequest())
+
+    mock_build.assert_not_called()
+    sent = mock_transport.send_request.call_args.args[0]
+    assert sent == build_frame(0xAA, 0x02, COMMAND_HIGH, 0x03, b"")
+
+
+@pytest.mark.phase6
+def test_request_builds_frame_without_prebuilt(mock_transport: Mock) -> None:
+    """Test a command registered after init is encoded on demand."""
+    client = BmsClient(mock_transport, product_id=0xAA, address=0x02, min_spacing_s=0.0)
+    del client._prebuilt[0x03]
+    mock_transport.send_request.return_value = build_frame(
+        0xAA, 0x02, COMMAND_HIGH, 0x03, bytes(15)
+    )
+
+    client.request(CurrentStatusRequest())
+
+    sent = mock_transport.send_request.call_args.args[0]
+    assert sent == build_frame(0xAA, 0x02, COMMAND_HIGH, 0x03, b"")
+
+
 @pytest.mark.phase6
 def test_request_unsupported_command(client: BmsClient) -> None:
     """Test request with unsupported command."""
@@ -136,24 +186,124 @@ def test_request_spacing() -> None:
     response_frame = build_frame(
         PRODUCT_ID_DEFAULT, 0x01, COMMAND_HIGH, 0x02, bytes(payload)
     )
-    mock_transport.send_request.return_value = response_frame
+    # Spacing is anchored at the send, so measure between sends
+    send_times: list[float] = []
+
+    def send_request(frame: bytes, timeout: float | None = None) -> bytes:
+        send_times.append(time.perf_counter())
+        return response_frame
+
+    mock_transport.send_request.side_effect = send_request
 
     client = BmsClient(mock_transport, min_spacing_s=0.1)
 
     req = VoltageRequest()
-
-    # First request
-    start_time = time.time()
     client.request(req)
-    first_time = time.time()
-
-    # Second request should be delayed
     client.request(req)
-    second_time = time.time()
 
-    # Should have waited at least min_spacing_s
-    elapsed = second_time - first_time
-    assert elapsed >= 0.1
+    # Second send should have waited at least min_spacing_s
+    assert len(send_times) == 2
+    assert send_times[1] - send_times[0] >= 0.1
+
+
+@pytest.mark.phase6
+def test_request_spacing_ignores_wall_clock(mock_transport: Mock) -> None:
+    """Test spacing is measured on a monotonic counter, not wall time."""
+    payload = bytearray([4, 3, 4])
+    for i in range(4):
+        payload.extend(struct.pack(">H", 3000))
+
+    mock_transport.send_request.return_value = build_frame(
+        PRODUCT_ID_DEFAULT, 0x01, COMMAND_HIGH, 0x02, bytes(payload)
+    )
+
+    client = BmsClient(mock_transport, min_spacing_s=0.1)
+    client.request(VoltageRequest())
+
+    # A wall clock step backwards must not stretch the wait
+    with patch("time.time", return_value=0.0), patch("time.sleep") as mock_sleep:
+        client.request(VoltageRequest())
+
+    mock_sleep.assert_called_once()
+    assert mock_sleep.call_args.args[0] <= 0.1
+
+
+@pytest.mark.phase6
+def test_read_all_spaces_batch_by_device_minimum(mock_transport: Mock) -> None:
+    """Test read_all uses device spacing inside the batch, client spacing after."""
+    payloads = {
+        0x02: bytes([4, 3, 4]) + struct.pack(">4H", 3000, 3000, 3000, 3000),
+        0x03: bytes(15),
+        0x04: b"\x01\x64\x02\x00\x64" + bytes(45),
+        0x11: b"\x04TEST",
+    }
+
+    def respond(frame: bytes, *, timeout: float | None = None) -> bytes:
+        cmd_lo = frame[5]
+        return build_frame(
+            PRODUCT_ID_DEFAULT, 0x01, COMMAND_HIGH, cmd_lo, payloads[cmd_lo]
+        )
+
+    mock_transport.send_request.side_effect = respond
+    client = BmsClient(mock_transport, min_spacing_s=5.0, device_min_spacing_s=0.01)
+
+    with patch("time.sleep") as mock_sleep:
+        results = client.read_all()
+
+    assert list(results) == [
+        "voltage_data",
+        "current_status",
+        "capacity_status",
+        "serial_number",
+    ]
+    assert results["serial_number"].serial_number == "TEST"
+    # Only device spacing was waited on between batch commands
+    assert all(c.args[0] <= 0.01 for c in mock_sleep.call_args_list)
+    assert client._next_allowed_ns - time.perf_counter_ns() > 4_000_000_000
+
+
+@pytest.mark.phase6
+def test_mos_control_sends_every_command_by_default(client: BmsClient) -> None:
+    """Test MOS commands are always sent unless skipping is enabled."""
+    ack = MosControlResponse(command_id=0xFF, status=0x00)
+
+    with patch.object(client, "_request_locked", return_value=ack) as mock_request:
+        assert client.disallow_charge()
+        assert client.disallow_charge()
+
+    assert mock_request.call_count == 2
+
+
+@pytest.mark.phase6
+def test_mos_control_skips_repeated_state(mock_transport: Mock) -> None:
+    """Test repeating the last commanded MOS state sends nothing when enabled."""
+    client = BmsClient(mock_transport, min_spacing_s=0.0, skip_redundant_mos=True)
+    ack = MosControlResponse(command_id=0xFF, status=0x00)
+
+    with patch.object(client, "_request_locked", return_value=ack) as mock_request:
+        assert client.allow_charge()
+        assert client.allow_charge()
+        assert mock_request.call_count == 1
+
+        # A different target state, another MOS, or force=True all send
+        assert client.disallow_charge()
+        assert client.allow_discharge()
+        assert client.allow_discharge(force=True)
+        assert mock_request.call_count == 4
+
+
+@pytest.mark.phase6
+def test_mos_state_cache_cleared_on_close(mock_transport: Mock) -> None:
+    """Test closing the client forgets the commanded MOS state."""
+    client = BmsClient(mock_transport, min_spacing_s=0.0, skip_redundant_mos=True)
+    ack = MosControlResponse(command_id=0xFF, status=0x00)
+
+    with patch.object(client, "_request_locked", return_value=ack) as mock_request:
+        client.disallow_discharge()
+        client.close()
+        client.disallow_discharge()
+
+    assert mock_request.call_count == 2
 
 
 @pytest.mark.phase6
@@ -12,10 +12,14 @@ from orion1000_bms.commands import (
     SerialNumberRequest,
     SerialNumberResponse,
     AllowDischargeRequest,
+    DisallowChargeRequest,
+    MosControlRequest,
     MosControlResponse,
     CommandId,
     COMMANDS,
 )
+from orion1000_bms.commands.base import CommandSpec
+from orion1000_bms.commands.registry import lookup_command, register_command
 
 
 @pytest.mark.phase5
@@ -134,6 +138,19 @@ def test_mos_control_request() -> None:
     assert req.to_payload() == b""
 
 
+@pytest.mark.phase5
+def test_mos_control_requests_share_one_class() -> None:
+    """Test MOS requests are distinct subclasses of one base."""
+    req = AllowDischargeRequest(address=0x02)
+    assert isinstance(req, AllowDischargeRequest)
+    assert isinstance(req, MosControlRequest)
+    assert req.address == 0x02
+    assert not isinstance(req, DisallowChargeRequest)
+
+    assert DisallowChargeRequest().command_id == CommandId.DISALLOW_CHARGE
+    assert COMMANDS[CommandId.DISALLOW_CHARGE].req is DisallowChargeRequest
+
+
 @pytest.mark.phase5
 def test_mos_control_response() -> None:
     """Test MOS control response parsing."""
@@ -158,4 +175,54 @@ def test_command_registry() -> None:
     # Test command specs
     voltage_spec = COMMANDS[CommandId.VOLTAGE_REQUEST]
     assert voltage_spec.req == VoltageRequest
-    assert voltage_spec.resp == VoltageResponse
\ No newline at end of file
+    assert voltage_spec.resp == VoltageResponse
+
+
+@pytest.mark.phase5
+def test_duplicate_registration_rejected() -> None:
+    """Test registering a command twice fails instead of overwriting."""
+    original = COMMANDS[CommandId.VOLTAGE_REQUEST]
+
+    with pytest.raises(ValueError, match="already registered"):
+        register_command(
+            CommandId.VOLTAGE_REQUEST,
+            CommandSpec(req=CurrentStatusRequest, resp=CurrentStatusResponse),
+        )
+
+    assert COMMANDS[CommandId.VOLTAGE_REQUEST] is original
+
+
+@pytest.mark.phase5
+def test_registry_is_read_only() -> None:
+    """Test the public registry view cannot be mutated directly."""
+    spec = COMMANDS[CommandId.VOLTAGE_REQUEST]
+    with pytest.raises(TypeError):
+        COMMANDS[CommandId.ALLOW_CHARGE] = spec  # type: ignore[index]
+
+    assert lookup_command(CommandId.VOLTAGE_REQUEST) is spec
+    assert lookup_command(0x9999) is None
+
+
+@pytest.mark.phase5
+def test_every_command_registered() -> None:
+    """Test every command id has a registered implementation."""
+    assert [cid.name for cid in CommandId if cid not in COMMANDS] == []
+
+
+@pytest.mark.phase5
+@pytest.mark.parametrize(
+    ("command_id", "resp"),
+    [
+        (CommandId.VOLTAGE_REQUEST, VoltageResponse),
+        (CommandId.CURRENT_STATUS_REQUEST, CurrentStatusResponse),
+        (CommandId.CAPACITY_STATUS_REQUEST, CapacityStatusResponse),
+        (CommandId.SERIAL_NUMBER_REQUEST, SerialNumberResponse),
+        (CommandId.ALLOW_DISCHARGE, MosControlResponse),
+        (CommandId.DISALLOW_DISCHARGE, MosControlResponse),
+        (CommandId.ALLOW_CHARGE, MosControlResponse),
+        (CommandId.DISALLOW_CHARGE, MosControlResponse),
+    ],
+)
+def test_registry_response_types(command_id: CommandId, resp: type) -> None:
+    """Test each command is registered with its canonical response parser."""
+    assert COMMANDS[command_id].resp is resp
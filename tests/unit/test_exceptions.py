@@ -3,7 +3,7 @@
 import pytest
 from orion1000_bms.exceptions import (
     BmsError, TransportError, TimeoutError, ChecksumError,
-    FrameError, ProtocolError, UnsupportedCommandError
+    FrameError, ProtocolError, UnsupportedCommandError, CircuitOpenError
 )
 
 
@@ -21,6 +21,9 @@ def test_exception_hierarchy() -> None:
     assert issubclass(TimeoutError, TransportError)
     assert issubclass(TimeoutError, BmsError)
 
+    # CircuitOpenError inherits from TransportError
+    assert issubclass(CircuitOpenError, TransportError)
+
 
 @pytest.mark.phase4
 def test_exception_instantiation() -> None:
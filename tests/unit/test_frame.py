@@ -1,5 +1,6 @@
 """Unit tests for frame encoding/decoding."""
 
+from dataclasses import asdict, fields
 import pytest
 from orion1000_bms.protocol.frame import Frame
 from orion1000_bms.protocol.codec import build_frame, decode
@@ -31,6 +32,43 @@ def test_frame_round_trip() -> None:
     assert decoded == frame
 
 
+@pytest.mark.phase2
+def test_frame_to_bytes_checksum() -> None:
+    """Test to_bytes computes a missing checksum and keeps a supplied one."""
+    header = {
+        "start": START,
+        "product_id": PRODUCT_ID_DEFAULT,
+        "address": 0x01,
+        "data_len": 0x04,
+        "cmd_hi": 0x03,
+        "cmd_lo": 0x00,
+        "payload": b"",
+        "end": END,
+    }
+
+    assert Frame(checksum=None, **header).to_bytes() == (
+        b"\xea\xd1\x01\x04\x03\x00\x07\xf5"
+    )
+    assert Frame(checksum=0x55, **header).to_bytes()[-2] == 0x55
+
+
+@pytest.mark.phase2
+def test_frame_to_bytes_cached() -> None:
+    """Test serialized bytes are reused and ignored by equality and hashing."""
+    raw = b"\xea\xd1\x01\x06\x03\x00\x12\x34\x23\xf5"
+    frame = Frame.from_bytes(raw)
+
+    first = frame.to_bytes()
+    assert first == raw
+    assert frame.to_bytes() is first
+
+    fresh = Frame.from_bytes(raw)
+    assert fresh == frame
+    assert hash(fresh) == hash(frame)
+    assert asdict(fresh) == asdict(frame)
+    assert "_cached_bytes" not in {f.name for f in fields(Frame)}
+
+
 @pytest.mark.phase2
 def test_build_frame() -> None:
     """Test build_frame function."""
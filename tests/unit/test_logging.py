@@ -1,6 +1,7 @@
 """Unit tests for logging utilities."""
 
 import logging
+from unittest.mock import patch
 import pytest
 from orion1000_bms.logging import get_logger, hex_dump, log_frame_tx, log_frame_rx
 
@@ -75,3 +76,33 @@ def test_log_frame_functions() -> None:
     # Test with empty frame
     log_frame_tx(logger, b"")
     log_frame_rx(logger, b"")
+
+
+@pytest.mark.phase4
+def test_log_frame_formats_hex_lazily(caplog: pytest.LogCaptureFixture) -> None:
+    """Test frame hex is only rendered when a record is emitted."""
+    logger = get_logger("test.frames.lazy")
+    frame = b"\xea\xd1\x01"
+
+    # DEBUG passes the isEnabledFor guard, but the only handler drops
+    # records below INFO, so the hex must never be rendered
+    handler = logging.StreamHandler()
+    handler.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    try:
+        with patch("orion1000_bms.logging.hex_dump") as mock_hex_dump:
+            log_frame_tx(logger, frame)
+            log_frame_rx(logger, frame)
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(logging.NOTSET)
+        logger.propagate = True
+    mock_hex_dump.assert_not_called()
+
+    with caplog.at_level(logging.DEBUG, logger="test.frames.lazy"):
+        log_frame_tx(logger, frame)
+        log_frame_rx(logger, frame)
+    assert "TX: EA D1 01" in caplog.text
+    assert "RX: EA D1 01 (3 bytes)" in caplog.text
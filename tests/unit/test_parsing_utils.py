@@ -6,7 +6,9 @@ from orion1000_bms.commands.parsing_utils import (
     parse_big_endian_uint16,
     parse_big_endian_int16,
     extract_bitfield_flags,
+    make_bitfield_extractor,
     parse_tagged_data,
+    parse_tagged_values,
 )
 
 
@@ -44,6 +46,18 @@ def test_extract_bitfield_flags() -> None:
     assert result == {"flag0": False, "flag1": False, "flag4": False}
 
 
+def test_make_bitfield_extractor() -> None:
+    """Test prebuilt extractor decodes bits beyond the first byte."""
+    extract = make_bitfield_extractor({0: "flag0", 9: "flag9", 15: "flag15"})
+
+    assert extract(0x0000) == {"flag0": False, "flag9": False, "flag15": False}
+    assert extract(0x8201) == {"flag0": True, "flag9": True, "flag15": True}
+    assert extract(0x0200) == {"flag0": False, "flag9": True, "flag15": False}
+
+    # Every call builds its own dictionary
+    assert extract(0x0001) is not extract(0x0001)
+
+
 def test_parse_tagged_data() -> None:
     """Test tag-based data parsing."""
     # Create test data: tag1(1 byte), tag2(2 bytes), tag3(1 byte)
@@ -78,3 +92,37 @@ def test_parse_tagged_data_unknown_tag() -> None:
         "field1": 0x42,
         "field2": 0x1234,
     }
+
+
+def test_parse_tagged_data_wide_and_absent_fields() -> None:
+    """Test wide fields are copied out and absent tags are omitted."""
+    data = b"\x04\xaa\xbb\xcc"
+
+    tag_map = {
+        0x01: ("field1", 1),  # Absent
+        0x04: ("field4", 3),
+    }
+
+    result = parse_tagged_data(data, tag_map)
+    assert result == {"field4": b"\xaa\xbb\xcc"}
+    assert type(result["field4"]) is bytes
+
+
+def test_parse_tagged_values() -> None:
+    """Test ordered tag parsing fills positions and keeps defaults."""
+    data = b"\x02\x12\x34\xff\x99\x01\x42\x04\xaa\xbb\xcc"  # Unknown tag 0xFF
+
+    tag_index = {
+        0x01: (0, 1),
+        0x02: (1, 2),
+        0x03: (2, 1),  # Absent, keeps default
+        0x04: (3, 3),
+    }
+
+    result = parse_tagged_values(data, tag_index, (0, 0, 7, b""))
+    assert result == [0x42, 0x1234, 7, b"\xaa\xbb\xcc"]
+    assert isinstance(result[3], memoryview)  # Wide fields are not copied
+
+    # Truncated field stops parsing
+    result = parse_tagged_values(b"\x01\x42\x02\x12", tag_index, (0, 0, 0, b""))
+    assert result == [0x42, 0, 0, b""]
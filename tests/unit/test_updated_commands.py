@@ -1,10 +1,14 @@
 """Tests for updated command parsing logic."""
 
+import copy
+import pickle
+from dataclasses import asdict
 import pytest
 from orion1000_bms.commands.voltage_request import VoltageResponse
 from orion1000_bms.commands.current_status_request import CurrentStatusResponse
 from orion1000_bms.commands.capacity_status_request import CapacityStatusResponse
 from orion1000_bms.commands.mos_control import MosControlResponse
+from orion1000_bms.commands.base import ResponseMetadata
 
 
 class TestVoltageResponse:
@@ -83,6 +87,33 @@ class TestCurrentStatusResponse:
         assert response.mos_state["discharge_mos_on"] is True
         assert response.mos_state["charge_mos_on"] is True
 
+    def test_to_dict_does_not_share_nested_values(self) -> None:
+        """Test mutating to_dict output leaves the frozen response intact."""
+        payload = b"\xff\x03" + b"\x00" * 7 + b"\x01\x50\x01\x00\x00"
+        response = CurrentStatusResponse.from_payload(payload)
+
+        result = response.to_dict()
+        result["status_flags"]["charge_active"] = True
+        result["temperatures"].append(0.0)
+
+        assert result["temperatures"][0] == 40.0
+        assert response.status_flags["charge_active"] is False
+        assert response.temperatures == [40.0]
+
+    def test_copy_and_pickle_round_trip(self) -> None:
+        """Test responses survive asdict, deepcopy and pickle."""
+        payload = b"\xff\x03\x03\x03\xe8" + b"\x00" * 4 + b"\x01\x50\x01\x06\x00"
+        response = CurrentStatusResponse.from_payload(payload)
+
+        result = asdict(response)
+        assert result["status_flags"]["charge_active"] is True
+        assert result["mos_state"] == response.mos_state
+
+        assert copy.deepcopy(response) == response
+        restored = pickle.loads(pickle.dumps(response))
+        assert restored == response
+        assert isinstance(restored.status_flags, dict)
+
 
 class TestCapacityStatusResponse:
     """Test capacity status response parsing with new protocol."""
@@ -103,6 +134,33 @@ class TestCapacityStatusResponse:
         assert response.soc == 100
         assert response.cycle_count == 100
 
+    def test_parse_fixed_tail_fields(self) -> None:
+        """Test fixed-position voltages and optional scheme/reserved bytes."""
+        data = bytearray(49)
+        data[42:48] = b"\x14\x50\x0d\x05\x0c\xe4"  # 52.00V, 3.333V, 3.300V
+
+        response = CapacityStatusResponse.from_payload(b"\xff\x04" + bytes(data))
+
+        assert response.pack_voltage == pytest.approx(52.0)
+        assert response.max_cell_voltage == pytest.approx(3.333)
+        assert response.min_cell_voltage == pytest.approx(3.3)
+        # Minimum-length frame carries no scheme id or reserved bytes
+        assert response.scheme_id == 0
+        assert response.reserved == b"\x00\x00\x00"
+
+    def test_parse_from_memoryview(self) -> None:
+        """Test parsing a view does not keep references into the buffer."""
+        buf = bytearray(b"\xff\x04" + b"\x01\x64" + b"\x00" * 56)
+        buf[52:55] = b"\x01\x02\x03"  # Reserved bytes
+
+        view = memoryview(buf)
+        response = CapacityStatusResponse.from_payload(view)
+        view.release()
+
+        assert response.reserved == b"\x01\x02\x03"
+        assert isinstance(response.reserved, bytes)
+        assert response.to_dict()["reserved"] == "010203"
+
 
 class TestMosControlResponse:
     """Test MOS control response parsing with new protocol."""
@@ -116,3 +174,31 @@ class TestMosControlResponse:
         assert response.command_id == 0xFF
         assert response.status == 0x00  # Success
         assert response.success is True
+
+
+class TestResponseMetadata:
+    """Test response metadata serialization."""
+
+    def test_response_time_computed_once(self) -> None:
+        """Test round-trip time is derived at construction."""
+        metadata = ResponseMetadata(
+            tcp_host="10.0.0.1",
+            tcp_port=26,
+            request_timestamp=100.0,
+            response_timestamp=100.123456,
+        )
+
+        assert metadata.response_time_ms == 123.46
+        assert metadata.to_dict()["response_time_ms"] == 123.46
+
+    def test_metadata_stored_in_slot(self) -> None:
+        """Test attaching metadata does not give responses an instance dict."""
+        response = MosControlResponse.from_payload(b"\xff\xff")
+        assert response.metadata is None
+
+        metadata = ResponseMetadata("10.0.0.1", 26, 100.0, 100.5)
+        response.set_metadata(metadata)
+
+        assert response.metadata is metadata
+        assert not hasattr(response, "__dict__")
+        assert response.to_dict()["_metadata"]["response_time_ms"] == 500.0
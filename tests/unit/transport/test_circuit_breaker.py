@@ -0,0 +1,178 @@
+"""Test circuit breaker behaviour in the transport layer."""
+
+import threading
+import pytest
+from unittest.mock import patch
+from orion1000_bms.transport.base import BaseTransport
+from orion1000_bms.transport.circuit_breaker import CircuitBreaker, CircuitState
+from orion1000_bms.transport.tcp import TcpTransport
+from orion1000_bms.exceptions import CircuitOpenError, TransportError
+
+
+class FailingTransport(BaseTransport):
+    """Transport whose requests fail until told otherwise."""
+
+    def __init__(self, breaker: CircuitBreaker) -> None:
+        super().__init__(max_retries=0, circuit_breaker=breaker)
+        self.call_count = 0
+        self.should_fail = True
+
+    def open_if_needed(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def _send_request_impl(
+        self, payload: bytes, *, timeout: float | None = None
+    ) -> bytes:
+        self.call_count += 1
+        if self.should_fail:
+            raise TransportError("Mock connection refused")
+        return b"response"
+
+
+def test_circuit_opens_after_threshold() -> None:
+    """Test requests fail fast once the failure threshold is reached."""
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30.0)
+    transport = FailingTransport(breaker)
+
+    for _ in range(3):
+        with pytest.raises(TransportError):
+            transport.send_request(b"test")
+
+    assert breaker.state is CircuitState.OPEN
+
+    # Rejected without touching the underlying transport
+    with pytest.raises(CircuitOpenError):
+        transport.send_request(b"test")
+    assert transport.call_count == 3
+
+
+def test_success_resets_failure_count() -> None:
+    """Test a successful request clears earlier failures."""
+    breaker = CircuitBreaker(failure_threshold=2)
+    transport = FailingTransport(breaker)
+
+    with pytest.raises(TransportError):
+        transport.send_request(b"test")
+
+    transport.should_fail = False
+    assert transport.send_request(b"test") == b"response"
+    assert breaker.failure_count == 0
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_half_open_probe_closes_circuit() -> None:
+    """Test a successful probe after reset_timeout closes the circuit."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0)
+    transport = FailingTransport(breaker)
+
+    with patch("time.monotonic", return_value=100.0):
+        with pytest.raises(TransportError):
+            transport.send_request(b"test")
+
+    transport.should_fail = False
+    with patch("time.monotonic", return_value=111.0):
+        assert transport.send_request(b"test") == b"response"
+
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_half_open_probe_failure_reopens_circuit() -> None:
+    """Test a failed probe opens the circuit for another reset_timeout."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0)
+    transport = FailingTransport(breaker)
+
+    with patch("time.monotonic", return_value=100.0):
+        with pytest.raises(TransportError):
+            transport.send_request(b"test")
+
+    with patch("time.monotonic", return_value=111.0):
+        with pytest.raises(TransportError):
+            transport.send_request(b"test")
+
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.opened_at == 111.0
+
+    with patch("time.monotonic", return_value=115.0):
+        with pytest.raises(CircuitOpenError):
+            transport.send_request(b"test")
+    assert transport.call_count == 2
+
+
+def test_tcp_circuit_breaker_is_opt_in() -> None:
+    """Test TcpTransport only fails fast when a threshold is configured."""
+    assert TcpTransport("localhost", 0).circuit_breaker is None
+
+    transport = TcpTransport("localhost", 0, circuit_failure_threshold=3)
+    assert transport.circuit_breaker is not None
+    assert transport.circuit_breaker.failure_threshold == 3
+
+
+def test_half_open_rejects_requests_while_probe_in_flight() -> None:
+    """Test only one probe is let through until its outcome is recorded."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0)
+
+    with patch("time.monotonic", return_value=100.0):
+        breaker.record_failure()
+
+    with patch("time.monotonic", return_value=111.0):
+        breaker.before_request()
+        assert breaker.state is CircuitState.HALF_OPEN
+        with pytest.raises(CircuitOpenError, match="probe request in flight"):
+            breaker.before_request()
+
+        breaker.record_success()
+        breaker.before_request()
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_aborted_probe_allows_another() -> None:
+    """Test a probe ending in a non-transport error frees the probe slot."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0)
+    transport = FailingTransport(breaker)
+
+    with patch("time.monotonic", return_value=100.0):
+        with pytest.raises(TransportError):
+            transport.send_request(b"test")
+
+    with patch("time.monotonic", return_value=111.0):
+        with patch.object(
+            transport, "_send_request_impl", side_effect=KeyboardInterrupt
+        ):
+            with pytest.raises(KeyboardInterrupt):
+                transport.send_request(b"test")
+
+        transport.should_fail = False
+        assert transport.send_request(b"test") == b"response"
+
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_half_open_admits_one_probe_across_threads() -> None:
+    """Test concurrent callers on a shared breaker get a single probe."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0)
+    with patch("time.monotonic", return_value=100.0):
+        breaker.record_failure()
+
+    callers = 8
+    barrier = threading.Barrier(callers)
+    admitted = []
+
+    def call() -> None:
+        barrier.wait()
+        try:
+            breaker.before_request()
+        except CircuitOpenError:
+            return
+        admitted.append(True)
+
+    with patch("time.monotonic", return_value=111.0):
+        threads = [threading.Thread(target=call) for _ in range(callers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert len(admitted) == 1
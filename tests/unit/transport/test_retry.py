@@ -3,14 +3,15 @@
 import pytest
 from unittest.mock import Mock, patch
 from orion1000_bms.transport.base import BaseTransport
+from orion1000_bms.transport.tcp import TcpTransport
 from orion1000_bms.exceptions import TimeoutError, TransportError
 
 
 class MockTransport(BaseTransport):
     """Mock transport for testing retry logic."""
 
-    def __init__(self, *, max_retries: int = 3) -> None:
-        super().__init__(max_retries=max_retries)
+    def __init__(self, *, max_retries: int = 3, **backoff: float) -> None:
+        super().__init__(max_retries=max_retries, **backoff)
         self.call_count = 0
         self.should_timeout = True
 
@@ -82,3 +83,49 @@ def test_configurable_max_retries() -> None:
 
     # Should have tried 2 times (initial + 1 retry)
     assert transport.call_count == 2
+
+
+def test_backoff_delay_grows_and_is_capped() -> None:
+    """Test retry delays double per attempt up to max_delay."""
+    transport = MockTransport(base_delay=0.1, max_delay=0.5, jitter=0.0)
+
+    delays = [transport._backoff_delay(attempt) for attempt in range(5)]
+
+    assert delays == pytest.approx([0.1, 0.2, 0.4, 0.5, 0.5])
+
+
+def test_backoff_delay_adds_bounded_jitter() -> None:
+    """Test jitter only ever lengthens the delay by up to the jitter bound."""
+    transport = MockTransport(base_delay=0.1, max_delay=10.0, jitter=0.05)
+
+    for _ in range(50):
+        assert 0.2 <= transport._backoff_delay(1) <= 0.25
+
+
+def test_retry_sleeps_with_backoff() -> None:
+    """Test timeout retries sleep for the backoff delay of each attempt."""
+    transport = MockTransport(max_retries=2, base_delay=0.1, jitter=0.0)
+
+    with patch("time.sleep") as mock_sleep:
+        with pytest.raises(TimeoutError):
+            transport.send_request(b"test")
+
+    assert [c.args[0] for c in mock_sleep.call_args_list] == pytest.approx(
+        [0.1, 0.2]
+    )
+
+
+def test_tcp_dropped_connection_attempts() -> None:
+    """Test TCP retries a dropped connection once, independent of max_retries."""
+    transport = TcpTransport("localhost", 0, max_retries=5)
+
+    with (
+        patch.object(
+            transport, "open_if_needed", side_effect=ConnectionResetError
+        ) as mock_open,
+        patch("time.sleep"),
+    ):
+        with pytest.raises(TransportError, match="Failed after 2 attempts"):
+            transport.send_request(b"test")
+
+    assert mock_open.call_count == 2